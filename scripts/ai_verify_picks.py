@@ -13,17 +13,21 @@ Usage:
     python scripts/ai_verify_picks.py
     python scripts/ai_verify_picks.py --date 2025-01-26
     python scripts/ai_verify_picks.py --dry-run  # Don't update database
+    python scripts/ai_verify_picks.py --concurrency 4  # Fewer parallel AI calls
+    python scripts/ai_verify_picks.py --no-cache  # Ignore cached verdicts
 """
 import argparse
+import asyncio
+import hashlib
 import json
 import os
 import sqlite3
 import sys
-from datetime import date
+import time
+from collections import defaultdict, deque
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
-import pandas as pd
-
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -36,6 +40,7 @@ except ImportError:
     pass
 
 from src.config import config
+from scripts.db_utils import ensure_indexes, open_db
 
 DB_PATH = config["database"]["path"]
 
@@ -47,21 +52,23 @@ except ImportError:
     HAS_ANTHROPIC = False
     print("Warning: anthropic package not installed. Install with: pip install anthropic")
 
+# orjson decodes pick factors faster when installed; stdlib json otherwise
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-VERIFICATION_PROMPT = """You are a sports betting analyst verifying a prop bet pick.
+AI_MODEL = "claude-3-5-haiku-20241022"  # Fast and cheap for verification
+DEFAULT_CONCURRENCY = 8  # Parallel AI calls in flight
+AI_RPM_LIMIT = 50  # Requests per minute allowed on our API tier
+CACHE_TTL_HOURS = 24  # Reuse a cached verdict for identical prompts this long
+RULE_CONFIRM_EDGE_PCT = 25  # Auto-CONFIRM above this edge when all averages agree
+RULE_FLAG_PROJECTION_GAP = 0.40  # Auto-FLAG when projection is this far from L10 on a thin sample
 
-PICK: {player} {pick} {line} {stat}
-OPPONENT: {opponent}
-MODEL EDGE: {edge_pct:+.1f}%
-PROJECTION: {projection}
 
-SUPPORTING DATA:
-- Last 10 games avg: {last_10_avg}
-- Season avg: {season_avg}
-- vs {opponent} history: {vs_opp_avg} ({vs_opp_games} games)
-- DvP rank: {dvp_rank} (1=worst D allows most, 30=best D)
-- Position: {position}
-- Games played: {season_games}
+# Fixed instructions, sent as a cacheable system block shared by every pick
+VERIFICATION_SYSTEM = """You are a sports betting analyst verifying a prop bet pick.
 
 VERIFY THIS PICK. Check for:
 1. Does the data actually support this edge?
@@ -80,64 +87,153 @@ VERDICT: CONFIRM or FLAG or REJECT
 CONFIDENCE: HIGH or MEDIUM or LOW
 REASON: [one clear sentence explaining your decision]"""
 
+# Per-pick data, sent as the user message
+VERIFICATION_PROMPT = """PICK: {player} {pick} {line} {stat}
+OPPONENT: {opponent}
+MODEL EDGE: {edge_pct:+.1f}%
+PROJECTION: {projection}
+
+SUPPORTING DATA:
+- Last 10 games avg: {last_10_avg}
+- Season avg: {season_avg}
+- vs {opponent} history: {vs_opp_avg} ({vs_opp_games} games)
+- DvP rank: {dvp_rank} (1=worst D allows most, 30=best D)
+- Position: {position}
+- Games played: {season_games}"""
+
+
+# Indexes behind the pick, context and verified-pick lookups
+VERIFY_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_props_edges_date_conf_edge "
+    "ON props_edges(date, confidence, ABS(edge_pct) DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_pgl_player_date ON player_game_logs(player_name, game_date DESC)",
+)
+
+# Stat -> player_game_logs column, for recent-form context
+STAT_COL_MAP = {
+    "PTS": "points", "REB": "rebounds", "AST": "assists",
+    "3PM": "threes_made", "STL": "steals", "BLK": "blocks",
+    "PRA": "pts_reb_ast", "PR": "pts_reb", "PA": "pts_ast", "RA": "reb_ast"
+}
+
+# Last 5 games per player for each stat. Players are bound as one JSON array
+# so the SQL text is fixed and stays in sqlite3's statement cache.
+_LAST5_SQL = {
+    stat: f"""
+        SELECT player_name, val, opponent, is_b2b
+        FROM (
+            SELECT player_name, {col} as val, opponent, is_b2b, game_date,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY player_name ORDER BY game_date DESC
+                   ) AS rn
+            FROM player_game_logs
+            WHERE player_name IN (SELECT value FROM json_each(?))
+        )
+        WHERE rn <= 5
+        ORDER BY player_name, rn
+    """
+    for stat, col in STAT_COL_MAP.items()
+}
+
+# Cached verdicts for a batch of prompt keys (bound as one JSON array)
+_CACHED_VERDICTS_SQL = """
+    SELECT key, verdict, confidence, reason
+    FROM verification_cache
+    WHERE key IN (SELECT value FROM json_each(?))
+      AND created_at >= ?
+"""
+
+# Verified picks for a date; the accepted verdicts are bound as a JSON array
+_VERIFIED_PICKS_SQL = """
+    SELECT e.*, v.verdict, v.ai_confidence, v.reason
+    FROM props_edges e
+    JOIN picks_verification v
+      ON e.date = v.date
+      AND e.player_name = v.player_name
+      AND e.prop_type = v.prop_type
+    WHERE e.date = ?
+      AND v.verdict IN (SELECT value FROM json_each(?))
+    ORDER BY
+        CASE v.verdict WHEN 'CONFIRM' THEN 1 ELSE 2 END,
+        CASE e.stat_tier WHEN 'S_TIER' THEN 1 ELSE 2 END,
+        e.confidence_score DESC
+"""
+
 
 def get_picks_to_verify(conn, target_date=None):
-    """Get HIGH and MEDIUM confidence picks that need verification."""
+    """
+    Get HIGH and MEDIUM confidence picks that need verification.
+
+    Returns:
+        List of pick dicts with factors decoded, highest confidence and edge first
+    """
     if target_date is None:
         target_date = date.today().isoformat()
 
-    picks = pd.read_sql("""
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    picks = cursor.execute("""
         SELECT player_name, opponent, prop_type, line, projection,
                edge, edge_pct, pick, confidence, stat_tier, factors
         FROM props_edges
         WHERE date = ?
           AND confidence IN ('HIGH', 'MEDIUM')
-        ORDER BY
-            CASE confidence WHEN 'HIGH' THEN 1 ELSE 2 END,
-            ABS(edge_pct) DESC
-    """, conn, params=(target_date,))
+        ORDER BY confidence, ABS(edge_pct) DESC  -- 'HIGH' < 'MEDIUM'; index order, no sort
+    """, (target_date,)).fetchall()
 
-    return picks
+    # Decode factors once here rather than per use downstream
+    return [{**pick, "factors": parse_factors(pick["factors"])} for pick in picks]
 
 
-def get_additional_context(player_name, opponent, stat, conn):
-    """Get additional context for verification."""
-    # Get last 5 games for recent form
-    stat_col_map = {
-        "PTS": "points", "REB": "rebounds", "AST": "assists",
-        "3PM": "threes_made", "STL": "steals", "BLK": "blocks",
-        "PRA": "pts_reb_ast", "PR": "pts_reb", "PA": "pts_ast", "RA": "reb_ast"
-    }
-    col = stat_col_map.get(stat, "points")
-
-    last_5 = pd.read_sql(f"""
-        SELECT {col} as val, opponent, home_away, days_rest, is_b2b
-        FROM player_game_logs
-        WHERE player_name = ?
-        ORDER BY game_date DESC
-        LIMIT 5
-    """, conn, params=(player_name,))
-
-    context = {
-        "last_5_values": last_5["val"].tolist() if not last_5.empty else [],
-        "last_5_avg": round(last_5["val"].mean(), 1) if not last_5.empty else None,
-        "recent_opponents": last_5["opponent"].tolist() if not last_5.empty else [],
-    }
+def parse_factors(raw):
+    """Decode a factors JSON blob into a dict; already-parsed or empty values pass through."""
+    if isinstance(raw, (str, bytes)):
+        return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+    return raw or {}
 
-    # Check if next game is B2B (would need schedule data)
-    # For now, use recent B2B rate as proxy
-    if not last_5.empty:
-        context["recent_b2b_rate"] = last_5["is_b2b"].mean()
 
-    return context
+def get_additional_context(picks, conn):
+    """
+    Get additional context for every pick, one query per stat type.
 
+    Args:
+        picks: Picks from get_picks_to_verify()
+        conn: SQLite connection
 
-def build_verification_prompt(pick, factors, additional_context):
-    """Build the verification prompt for a pick."""
-    # Parse factors JSON
-    if isinstance(factors, str):
-        factors = json.loads(factors)
+    Returns:
+        dict of (player_name, prop_type) -> context dict
+    """
+    players_by_stat = defaultdict(set)
+    for pick in picks:
+        players_by_stat[pick["prop_type"]].add(pick["player_name"])
+
+    contexts = {}
+    for stat, players in players_by_stat.items():
+        query = _LAST5_SQL.get(stat, _LAST5_SQL["PTS"])
+        rows = conn.execute(query, (json.dumps(sorted(players)),)).fetchall()
+
+        last_5 = defaultdict(list)
+        for player_name, val, opponent, is_b2b in rows:
+            last_5[player_name].append((val, opponent, is_b2b))
+
+        for player_name, games in last_5.items():
+            values = [g[0] for g in games]
+            known = [v for v in values if v is not None]
+            context = {
+                "last_5_values": values,
+                "last_5_avg": round(sum(known) / len(known), 1) if known else None,
+                "recent_opponents": [g[1] for g in games],
+                # Check if next game is B2B (would need schedule data)
+                # For now, use recent B2B rate as proxy
+                "recent_b2b_rate": sum(g[2] or 0 for g in games) / len(games),
+            }
+            contexts[(player_name, stat)] = context
 
+    return contexts
+
+
+def build_verification_prompt(pick, factors, additional_context):
+    """Build the verification prompt for a pick from its decoded factors dict."""
     prompt = VERIFICATION_PROMPT.format(
         player=pick["player_name"],
         pick=pick["pick"],
@@ -164,47 +260,140 @@ def build_verification_prompt(pick, factors, additional_context):
     return prompt
 
 
-def verify_pick_with_ai(prompt, dry_run=False):
-    """Send pick to Claude for verification."""
+def _rule_based_verdict(pick, factors, additional_context):
+    """
+    Decide clear-cut picks without calling the AI.
+
+    - CONFIRM: edge > RULE_CONFIRM_EDGE_PCT and L10, season and vs-opponent
+      averages all sit on the pick's side of the line
+    - FLAG: fewer than 2 games vs opponent and the projection is more than
+      RULE_FLAG_PROJECTION_GAP away from the L10 average
+
+    Returns:
+        Verification dict (verdict, confidence, reason), or None to defer to the AI
+    """
+    line = pick["line"]
+    over = pick["pick"] == "OVER"
+    l10 = factors.get("last_10_avg")
+    averages = [l10, factors.get("season_avg"), factors.get("vs_opp_avg")]
+
+    if abs(pick["edge_pct"]) > RULE_CONFIRM_EDGE_PCT and all(
+        isinstance(avg, (int, float)) and (avg > line if over else avg < line)
+        for avg in averages
+    ):
+        return {
+            "verdict": "CONFIRM",
+            "confidence": "HIGH",
+            "reason": "Rule: large edge with L10, season and vs-opponent averages all past the line"
+        }
+
+    vs_opp_games = factors.get("vs_opp_games") or 0
+    if (vs_opp_games < 2 and isinstance(l10, (int, float)) and l10 > 0
+            and abs(pick["projection"] - l10) / l10 > RULE_FLAG_PROJECTION_GAP):
+        return {
+            "verdict": "FLAG",
+            "confidence": "LOW",
+            "reason": "Rule: projection far from L10 average with under 2 games vs opponent"
+        }
+
+    return None
+
+
+class RateLimiter:
+    """Sliding-window limiter: at most `rpm` requests in any `window` seconds."""
+
+    def __init__(self, rpm=AI_RPM_LIMIT, window=60.0):
+        self.rpm = rpm
+        self.window = window
+        self.sent = deque()
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        """Block until another request fits in the window, then record it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                while self.sent and now - self.sent[0] >= self.window:
+                    self.sent.popleft()
+                if len(self.sent) < self.rpm:
+                    self.sent.append(now)
+                    return
+                await asyncio.sleep(self.window - (now - self.sent[0]))
+
+
+async def verify_pick_with_ai(prompt, client, semaphore, limiter):
+    """Send one pick to Claude for verification."""
+    async with semaphore:
+        await limiter.wait()
+        try:
+            message = await client.messages.create(
+                model=AI_MODEL,
+                max_tokens=150,
+                system=[{
+                    "type": "text",
+                    "text": VERIFICATION_SYSTEM,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+
+            response_text = message.content[0].text.strip()
+            return parse_verification_response(response_text)
+
+        except Exception as e:
+            print(f"  AI verification error: {e}")
+            return {
+                "verdict": "FLAG",
+                "confidence": "LOW",
+                "reason": f"Verification failed: {str(e)[:50]}",
+                "failed": True
+            }
+
+
+async def verify_prompts_async(prompts, dry_run=False, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Verify all prompts concurrently.
+
+    Args:
+        prompts: List of verification prompts
+        dry_run: Return mock verdicts without calling the API
+        concurrency: Max AI calls in flight at once
+
+    Returns:
+        List of verification dicts, in the same order as prompts
+    """
     if dry_run or not HAS_ANTHROPIC:
         # Return mock response for testing
-        return {
+        return [{
             "verdict": "CONFIRM",
             "confidence": "MEDIUM",
             "reason": "Dry run - no AI verification performed"
-        }
+        } for _ in prompts]
 
     # Get API key from environment
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         print("Warning: ANTHROPIC_API_KEY not set. Using mock response.")
-        return {
+        return [{
             "verdict": "FLAG",
             "confidence": "LOW",
-            "reason": "API key not configured"
-        }
-
-    try:
-        client = anthropic.Anthropic(api_key=api_key)
-
-        message = client.messages.create(
-            model="claude-3-5-haiku-20241022",  # Fast and cheap for verification
-            max_tokens=150,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
+            "reason": "API key not configured",
+            "failed": True
+        } for _ in prompts]
 
-        response_text = message.content[0].text.strip()
-        return parse_verification_response(response_text)
+    client = anthropic.AsyncAnthropic(api_key=api_key)
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter()
 
-    except Exception as e:
-        print(f"  AI verification error: {e}")
-        return {
-            "verdict": "FLAG",
-            "confidence": "LOW",
-            "reason": f"Verification failed: {str(e)[:50]}"
-        }
+    try:
+        return await asyncio.gather(*(
+            verify_pick_with_ai(prompt, client, semaphore, limiter)
+            for prompt in prompts
+        ))
+    finally:
+        await client.close()
 
 
 def parse_verification_response(response_text):
@@ -233,49 +422,95 @@ def parse_verification_response(response_text):
     return result
 
 
-def save_verification_results(results, conn, target_date):
-    """Save verification results to database."""
-    # Create verification table if not exists
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS picks_verification (
-            date TEXT,
-            player_name TEXT,
-            prop_type TEXT,
-            verdict TEXT,
-            ai_confidence TEXT,
-            reason TEXT,
-            PRIMARY KEY (date, player_name, prop_type)
-        )
-    """)
+def init_verification_tables(conn):
+    """Create the verification results and verdict cache tables if needed."""
+    with conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS picks_verification (
+                date TEXT,
+                player_name TEXT,
+                prop_type TEXT,
+                verdict TEXT,
+                ai_confidence TEXT,
+                reason TEXT,
+                PRIMARY KEY (date, player_name, prop_type)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS verification_cache (
+                key TEXT PRIMARY KEY,
+                verdict TEXT,
+                confidence TEXT,
+                reason TEXT,
+                created_at TEXT
+            )
+        """)
+
+
+def prompt_cache_key(prompt):
+    """Cache key for a prompt; includes the model and instructions so changing either misses."""
+    return hashlib.sha256(f"{AI_MODEL}\n{VERIFICATION_SYSTEM}\n{prompt}".encode("utf-8")).hexdigest()
 
-    # Clear existing results for today
-    conn.execute("""
-        DELETE FROM picks_verification WHERE date = ?
-    """, (target_date,))
 
-    # Insert new results
-    for result in results:
+def get_cached_verdicts(conn, keys, ttl_hours=CACHE_TTL_HOURS):
+    """
+    Look up cached verdicts newer than the TTL.
+
+    Returns:
+        dict of key -> verification dict (verdict, confidence, reason)
+    """
+    if not keys:
+        return {}
+
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=ttl_hours)).isoformat(timespec="seconds")
+    rows = conn.execute(_CACHED_VERDICTS_SQL, (json.dumps(list(keys)), cutoff)).fetchall()
+
+    return {
+        key: {"verdict": verdict, "confidence": confidence, "reason": reason}
+        for key, verdict, confidence, reason in rows
+    }
+
+
+def save_cached_verdicts(conn, entries):
+    """Store (key, verification) pairs in the verdict cache."""
+    created_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    with conn:
+        conn.executemany("""
+            INSERT OR REPLACE INTO verification_cache
+            (key, verdict, confidence, reason, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (key, v["verdict"], v["confidence"], v["reason"], created_at)
+            for key, v in entries
+        ])
+
+
+def save_verification_results(results, conn, target_date):
+    """Save verification results to database, replacing the day's previous run."""
+    rows = [
+        (target_date, r["player_name"], r["prop_type"], r["verdict"], r["ai_confidence"], r["reason"])
+        for r in results
+    ]
+
+    with conn:
         conn.execute("""
+            DELETE FROM picks_verification WHERE date = ?
+        """, (target_date,))
+        conn.executemany("""
             INSERT OR REPLACE INTO picks_verification
             (date, player_name, prop_type, verdict, ai_confidence, reason)
             VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            target_date,
-            result["player_name"],
-            result["prop_type"],
-            result["verdict"],
-            result["ai_confidence"],
-            result["reason"]
-        ))
-
-    conn.commit()
+        """, rows)
 
 
 def display_results(results):
     """Display verification results."""
-    confirmed = [r for r in results if r["verdict"] == "CONFIRM"]
-    flagged = [r for r in results if r["verdict"] == "FLAG"]
-    rejected = [r for r in results if r["verdict"] == "REJECT"]
+    by_verdict = defaultdict(list)
+    for r in results:
+        by_verdict[r["verdict"]].append(r)
+    confirmed = by_verdict["CONFIRM"]
+    flagged = by_verdict["FLAG"]
+    rejected = by_verdict["REJECT"]
 
     print("\n" + "=" * 60)
     print("  AI VERIFICATION RESULTS")
@@ -312,14 +547,15 @@ def display_results(results):
     print("=" * 60)
 
 
-def verify_picks(conn, target_date=None, dry_run=False, verbose=True):
+def verify_picks(conn, target_date=None, dry_run=False, verbose=True,
+                 concurrency=DEFAULT_CONCURRENCY, use_cache=True):
     """Main verification function."""
     if target_date is None:
         target_date = date.today().isoformat()
 
     picks = get_picks_to_verify(conn, target_date)
 
-    if picks.empty:
+    if not picks:
         print("No HIGH/MEDIUM confidence picks to verify.")
         return []
 
@@ -328,26 +564,58 @@ def verify_picks(conn, target_date=None, dry_run=False, verbose=True):
         if dry_run:
             print("(DRY RUN - no AI calls)")
 
-    results = []
+    # Get additional context for all picks at once
+    contexts = get_additional_context(picks, conn)
+
+    verifications = [None] * len(picks)
+
+    # Settle clear-cut picks by rule; build prompts for the rest up front so
+    # the AI calls can run concurrently
+    ai_indices = []
+    prompts = []
+    for i, pick in enumerate(picks):
+        factors = pick["factors"]
+        additional_context = contexts.get((pick["player_name"], pick["prop_type"]), {})
+
+        rule_verdict = _rule_based_verdict(pick, factors, additional_context)
+        if rule_verdict:
+            verifications[i] = rule_verdict
+        else:
+            ai_indices.append(i)
+            prompts.append(build_verification_prompt(pick, factors, additional_context))
+
+    # Reuse cached verdicts for prompts we've already sent (never in dry run)
+    use_cache = use_cache and not dry_run
+    keys = [prompt_cache_key(prompt) for prompt in prompts]
+    cached = {}
+    if use_cache:
+        cached = get_cached_verdicts(conn, keys)
+    misses = [j for j, key in enumerate(keys) if key not in cached]
 
-    for _, pick in picks.iterrows():
-        if verbose:
-            print(f"\n  Verifying: {pick['player_name']} {pick['pick']} {pick['line']} {pick['prop_type']}...")
-
-        # Get additional context
-        additional_context = get_additional_context(
-            pick["player_name"],
-            pick["opponent"],
-            pick["prop_type"],
-            conn
-        )
+    if verbose:
+        print(f"  {len(picks) - len(prompts)} rule-based, {len(prompts) - len(misses)} cached, "
+              f"{len(misses)} AI calls")
 
-        # Build prompt
-        prompt = build_verification_prompt(pick, pick["factors"], additional_context)
+    # Verify with AI
+    fresh = asyncio.run(
+        verify_prompts_async([prompts[j] for j in misses], dry_run=dry_run, concurrency=concurrency)
+    )
 
-        # Verify with AI
-        verification = verify_pick_with_ai(prompt, dry_run=dry_run)
+    for j, key in enumerate(keys):
+        if key in cached:
+            verifications[ai_indices[j]] = cached[key]
+    for j, verification in zip(misses, fresh):
+        verifications[ai_indices[j]] = verification
 
+    if use_cache:
+        save_cached_verdicts(conn, [
+            (keys[j], verification) for j, verification in zip(misses, fresh)
+            if not verification.get("failed")
+        ])
+
+    results = []
+
+    for pick, verification in zip(picks, verifications):
         # Combine pick data with verification result
         result = {
             "player_name": pick["player_name"],
@@ -366,7 +634,8 @@ def verify_picks(conn, target_date=None, dry_run=False, verbose=True):
         results.append(result)
 
         if verbose:
-            print(f"    -> {verification['verdict']} ({verification['confidence']})")
+            print(f"  {pick['player_name']} {pick['pick']} {pick['line']} {pick['prop_type']}"
+                  f" -> {verification['verdict']} ({verification['confidence']})")
 
     # Save results
     if not dry_run:
@@ -376,26 +645,20 @@ def verify_picks(conn, target_date=None, dry_run=False, verbose=True):
 
 
 def get_verified_picks(conn, target_date=None, include_flagged=False):
-    """Get verified picks for daily card generation."""
+    """
+    Get verified picks for daily card generation.
+
+    Returns:
+        List of sqlite3.Row picks with verdict, ai_confidence and reason
+    """
     if target_date is None:
         target_date = date.today().isoformat()
 
-    verdicts = "('CONFIRM')" if not include_flagged else "('CONFIRM', 'FLAG')"
-
-    picks = pd.read_sql(f"""
-        SELECT e.*, v.verdict, v.ai_confidence, v.reason
-        FROM props_edges e
-        JOIN picks_verification v
-          ON e.date = v.date
-          AND e.player_name = v.player_name
-          AND e.prop_type = v.prop_type
-        WHERE e.date = ?
-          AND v.verdict IN {verdicts}
-        ORDER BY
-            CASE v.verdict WHEN 'CONFIRM' THEN 1 ELSE 2 END,
-            CASE e.stat_tier WHEN 'S_TIER' THEN 1 ELSE 2 END,
-            e.confidence_score DESC
-    """, conn, params=(target_date,))
+    verdicts = ["CONFIRM", "FLAG"] if include_flagged else ["CONFIRM"]
+
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    picks = cursor.execute(_VERIFIED_PICKS_SQL, (target_date, json.dumps(verdicts))).fetchall()
 
     return picks
 
@@ -405,19 +668,26 @@ def main():
     parser.add_argument("--date", type=str, help="Target date (YYYY-MM-DD)")
     parser.add_argument("--dry-run", action="store_true", help="Don't call AI or update database")
     parser.add_argument("--quiet", action="store_true", help="Minimal output")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Max parallel AI calls (default {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached AI verdicts")
 
     args = parser.parse_args()
 
     target_date = args.date or date.today().isoformat()
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_db(DB_PATH, row_factory=sqlite3.Row)
+    init_verification_tables(conn)
+    ensure_indexes(conn, VERIFY_INDEXES)
 
     # Run verification
     results = verify_picks(
         conn,
         target_date=target_date,
         dry_run=args.dry_run,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        concurrency=args.concurrency,
+        use_cache=not args.no_cache
     )
 
     # Display results
@@ -11,23 +11,28 @@ Usage:
 """
 import argparse
 import csv
+import json
+import os
 import re
 import sqlite3
 import subprocess
 import sys
-from datetime import date
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import requests
-
 PROJECT_ROOT = Path(__file__).parent.parent
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
+from src.utils import requests_retry_session
+from scripts.db_utils import ensure_indexes, open_db, utc_date_range
+from scripts.shared_utils import parse_prop_pick
 
 DB_PATH = config["database"]["path"]
 RESULTS_CSV = PROJECT_ROOT / 'data' / 'results.csv'
+ESPN_CACHE_DIR = PROJECT_ROOT / 'data' / 'espn_cache'
 CANONICAL_FIELDS = ['date', 'game', 'bet_type', 'pick', 'line', 'vegas_line', 'tier', 'edge', 'result', 'actual']
 
 # ESPN to standard abbreviation mapping (same as run_daily.py)
@@ -36,6 +41,21 @@ ESPN_TO_STD = {
     'GS': 'GSW', 'NO': 'NOP', 'PHO': 'PHX', 'PHOE': 'PHX'
 }
 
+# Scoreboard cache lifetimes
+ESPN_CACHE_LIVE_SECONDS = 90  # Some games still in progress
+ESPN_CACHE_FINAL_SECONDS = 7 * 24 * 3600  # Every game final - scores won't change
+ESPN_FETCH_WORKERS = 8  # Parallel scoreboard fetches for multi-date runs
+
+# Pick string patterns: 'BOS -17.7'
+_TEAM_RE = re.compile(r'^([A-Z]{2,4})\s+[+-]?\d')
+_SPREAD_RE = re.compile(r'^[A-Z]{2,4}\s+([+-]?\d+\.?\d*)')
+
+# Shared HTTP session so repeated (and parallel) ESPN calls reuse pooled
+# connections, with backoff on rate limits and transient gateway errors
+_SESSION = requests_retry_session(
+    retries=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504), timeout=30
+)
+
 # Stat column mapping for prop resolution
 # NOTE: Keep in sync with STAT_COLS in scripts/project_props.py (used for projections)
 STAT_MAP = {
@@ -48,15 +68,59 @@ STAT_MAP = {
     'PR': ['pts', 'reb'],
     '3PM': ['fg3m'],
 }
+PLAYERBOX_STAT_COLS = sorted({c for cols in STAT_MAP.values() for c in cols})
+
+# Indexes behind the per-date PlayerBox lookup
+RESULTS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_games_date_time ON Games(date_time_utc)",
+    "CREATE INDEX IF NOT EXISTS idx_playerbox_player ON PlayerBox(player_name)",
+    "CREATE INDEX IF NOT EXISTS idx_playerbox_game ON PlayerBox(game_id)",
+)
+
+# Stat lines for a JSON array of players on one date
+_PLAYER_STATS_SQL = f'''
+    SELECT pb.player_name, {', '.join(f'pb.{c}' for c in PLAYERBOX_STAT_COLS)}
+    FROM PlayerBox pb
+    JOIN Games g ON pb.game_id = g.game_id
+    WHERE pb.player_name IN (SELECT value FROM json_each(?))
+      AND g.date_time_utc >= ? AND g.date_time_utc < ?
+'''
+
+
+def _read_scoreboard_cache(target_date):
+    """Return cached games for a date if the cache is still fresh, else None."""
+    cache_file = ESPN_CACHE_DIR / f"{target_date}.json"
+    try:
+        games = json.loads(cache_file.read_text(encoding='utf-8'))
+        age = time.time() - cache_file.stat().st_mtime
+    except (OSError, ValueError):
+        return None
+
+    all_final = all(g['is_final'] for g in games)
+    ttl = ESPN_CACHE_FINAL_SECONDS if all_final else ESPN_CACHE_LIVE_SECONDS
+    return games if age < ttl else None
+
+
+def _write_scoreboard_cache(target_date, games):
+    """Store parsed games for a date; cache failures are non-fatal."""
+    try:
+        ESPN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (ESPN_CACHE_DIR / f"{target_date}.json").write_text(json.dumps(games), encoding='utf-8')
+    except OSError as e:
+        print(f"  [WARN] Could not write ESPN cache: {e}")
 
 
 def fetch_espn_scoreboard(target_date):
     """Fetch ESPN scoreboard for a date. Returns list of game dicts."""
+    cached = _read_scoreboard_cache(target_date)
+    if cached is not None:
+        return cached
+
     date_fmt = target_date.replace('-', '')
     url = f'https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date_fmt}'
 
     try:
-        resp = requests.get(url, timeout=30)
+        resp = _SESSION.get(url, timeout=30)
         resp.raise_for_status()
         data = resp.json()
     except Exception as e:
@@ -89,12 +153,15 @@ def fetch_espn_scoreboard(target_date):
             'is_final': is_final,
         })
 
+    if games:
+        _write_scoreboard_cache(target_date, games)
+
     return games
 
 
 def extract_team_from_pick(pick_str):
     """Extract team abbreviation from a spread pick like 'BOS -17.7' or 'WAS -6.9'."""
-    match = re.match(r'^([A-Z]{2,4})\s+[+-]?\d', pick_str)
+    match = _TEAM_RE.match(pick_str)
     if match:
         return match.group(1)
     return None
@@ -102,7 +169,7 @@ def extract_team_from_pick(pick_str):
 
 def extract_spread_from_pick(pick_str):
     """Extract spread value from pick like 'BOS -17.7' -> -17.7."""
-    match = re.match(r'^[A-Z]{2,4}\s+([+-]?\d+\.?\d*)', pick_str)
+    match = _SPREAD_RE.match(pick_str)
     if match:
         return float(match.group(1))
     return None
@@ -152,21 +219,36 @@ def resolve_spread(pick_str, line, espn_games):
     return result, str(margin)
 
 
-def parse_prop_pick(pick_str):
+def get_player_stats_for_date(player_names, pick_date, conn):
     """
-    Parse a prop pick string.
-    'Tyler Kolek OVER 2.4 RA' -> (player_name, direction, line, stat)
-    'Matas Buzelis OVER 13.1 PRA' -> (player_name, direction, line, stat)
+    Fetch PlayerBox stat lines for a set of players on one date in a single query.
+
+    Returns:
+        dict of player_name -> {stat column: value} for every column in STAT_MAP
     """
-    match = re.match(r'^(.+?)\s+(OVER|UNDER)\s+(\d+\.?\d*)\s+(\w+)$', pick_str)
-    if match:
-        return match.group(1), match.group(2), float(match.group(3)), match.group(4)
-    return None, None, None, None
+    if not player_names:
+        return {}
+
+    try:
+        rows = conn.execute(
+            _PLAYER_STATS_SQL, (json.dumps(sorted(player_names)), *utc_date_range(pick_date))
+        ).fetchall()
+    except sqlite3.Error as e:
+        print(f"  [ERROR] PlayerBox query failed for {pick_date}: {e}")
+        return {}
+
+    stats = {}
+    for row in rows:
+        stats.setdefault(row[0], dict(zip(PLAYERBOX_STAT_COLS, row[1:])))
+    return stats
 
 
-def resolve_prop(pick_str, game_str, pick_date, conn, espn_games):
+def resolve_prop(pick_str, game_str, espn_games, player_stats):
     """
-    Resolve a PROP pick by querying PlayerBox.
+    Resolve a PROP pick against PlayerBox stat lines.
+
+    Args:
+        player_stats: dict from get_player_stats_for_date() for the pick's date
 
     Returns (result, actual) or (None, None) if data not available.
     """
@@ -199,29 +281,16 @@ def resolve_prop(pick_str, game_str, pick_date, conn, espn_games):
     if not game_final and opponent:
         return None, None
 
-    # Query PlayerBox for the actual stat
-    cols = STAT_MAP[stat]
-    col_expr = ' + '.join(f'pb.{c}' for c in cols)
-
-    query = f'''
-        SELECT {col_expr} as stat_value
-        FROM PlayerBox pb
-        JOIN Games g ON pb.game_id = g.game_id
-        WHERE pb.player_name = ?
-          AND DATE(g.date_time_utc) = ?
-        LIMIT 1
-    '''
-
-    try:
-        result = conn.execute(query, (player_name, pick_date)).fetchone()
-    except Exception as e:
-        print(f"  [ERROR] DB query failed for {player_name}: {e}")
+    # Look up the actual stat
+    box = player_stats.get(player_name)
+    if not box:
         return None, None
 
-    if not result or result[0] is None:
+    values = [box[c] for c in STAT_MAP[stat]]
+    if any(v is None for v in values):
         return None, None
 
-    actual = result[0]
+    actual = sum(values)
 
     if direction == 'OVER':
         pick_result = 'W' if actual > line else 'L'
@@ -231,6 +300,16 @@ def resolve_prop(pick_str, game_str, pick_date, conn, espn_games):
     return pick_result, str(int(actual) if actual == int(actual) else actual)
 
 
+def write_results_csv(rows):
+    """Rewrite results.csv atomically so an interrupted run can't truncate it."""
+    tmp_path = RESULTS_CSV.with_suffix('.csv.tmp')
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CANONICAL_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, RESULTS_CSV)
+
+
 def run_auto_results(target_date=None, dry_run=False):
     """Main auto-results logic."""
     if not RESULTS_CSV.exists():
@@ -255,14 +334,18 @@ def run_auto_results(target_date=None, dry_run=False):
     dates = sorted(set(row['date'] for _, row in pending))
     print(f"Resolving {len(pending)} pending picks across {len(dates)} date(s)")
 
-    conn = sqlite3.connect(DB_PATH)
+    # Fetch all ESPN scoreboards up front, in parallel
+    with ThreadPoolExecutor(max_workers=min(ESPN_FETCH_WORKERS, len(dates))) as pool:
+        espn_by_date = dict(zip(dates, pool.map(fetch_espn_scoreboard, dates)))
+
+    conn = open_db(DB_PATH, row_factory=sqlite3.Row)
+    ensure_indexes(conn, RESULTS_INDEXES)
     updated = 0
 
     for pick_date in dates:
         print(f"\n--- {pick_date} ---")
 
-        # Fetch ESPN scoreboard for this date
-        espn_games = fetch_espn_scoreboard(pick_date)
+        espn_games = espn_by_date[pick_date]
         final_count = sum(1 for g in espn_games if g['is_final'])
         print(f"  ESPN: {len(espn_games)} games, {final_count} final")
 
@@ -271,6 +354,14 @@ def run_auto_results(target_date=None, dry_run=False):
 
         date_picks = [(i, row) for i, row in pending if row['date'] == pick_date]
 
+        # One PlayerBox query for every prop player on this date
+        prop_players = {
+            parse_prop_pick(row.get('pick', ''))[0]
+            for _, row in date_picks if row.get('bet_type', 'PROP') == 'PROP'
+        }
+        prop_players.discard(None)
+        player_stats = get_player_stats_for_date(prop_players, pick_date, conn)
+
         for idx, row in date_picks:
             bet_type = row.get('bet_type', 'PROP')
             pick = row.get('pick', '')
@@ -278,7 +369,7 @@ def run_auto_results(target_date=None, dry_run=False):
             if bet_type == 'SPREAD':
                 result, actual = resolve_spread(pick, row.get('line', ''), espn_games)
             elif bet_type == 'PROP':
-                result, actual = resolve_prop(pick, row.get('game', ''), pick_date, conn, espn_games)
+                result, actual = resolve_prop(pick, row.get('game', ''), espn_games, player_stats)
             else:
                 continue
 
@@ -297,10 +388,7 @@ def run_auto_results(target_date=None, dry_run=False):
 
     # Write back
     if updated > 0 and not dry_run:
-        with open(RESULTS_CSV, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=CANONICAL_FIELDS)
-            writer.writeheader()
-            writer.writerows(rows)
+        write_results_csv(rows)
         print(f"\nUpdated {updated} picks in results.csv")
 
         # Update performance tracker
@@ -314,7 +402,6 @@ def run_auto_results(target_date=None, dry_run=False):
 
         # Post results to Discord if webhooks configured
         try:
-            import os
             if os.getenv('DISCORD_WEBHOOK_RESULTS'):
                 from scripts.discord_poster import get_webhooks, post_results_update
                 webhooks = get_webhooks()
@@ -7,12 +7,14 @@ This mimics what happens when you run the daily pipeline, then checks if picks w
 Usage:
     python scripts/backtest_daily_pipeline.py
     python scripts/backtest_daily_pipeline.py --start 2025-11-01 --end 2026-01-15
+    python scripts/backtest_daily_pipeline.py --workers 4   # Split the date range across 4 processes
 """
 import argparse
-import sqlite3
 import sys
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from itertools import repeat
 from pathlib import Path
 
 import numpy as np
@@ -22,11 +24,55 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
-from scripts.shared_utils import get_team_recent_games, calculate_team_stats
-from scripts.rest_detection import get_team_rest_info, calculate_rest_adjustment
+from scripts.db_utils import ensure_indexes, open_db, utc_date_range
+from scripts.rest_detection import get_team_rest_info_batch, calculate_rest_adjustment
 
 DB_PATH = config["database"]["path"]
 
+# Indexes behind the range and join lookups in run_backtest
+BACKTEST_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_games_date_time ON Games(date_time_utc)",
+    "CREATE INDEX IF NOT EXISTS idx_gamestates_final_date ON GameStates(is_final_state, game_date)",
+    "CREATE INDEX IF NOT EXISTS idx_teambox_game_team ON TeamBox(game_id, team_id, pts)",
+)
+
+# Backtest games in a date_time_utc range (see utc_date_range)
+_GAMES_SQL = """
+    SELECT g.game_id, g.home_team, g.away_team, DATE(g.date_time_utc) as game_date
+    FROM Games g
+    JOIN Betting b ON g.game_id = b.game_id
+    WHERE g.date_time_utc >= ? AND g.date_time_utc < ?
+      AND g.season = '2025-2026'
+    ORDER BY g.date_time_utc
+"""
+
+# Vegas lines for every game in a date_time_utc range
+_VEGAS_SQL = """
+    SELECT b.game_id, b.espn_current_spread, b.espn_closing_spread, b.covers_closing_spread
+    FROM Betting b
+    JOIN Games g ON b.game_id = g.game_id
+    WHERE g.date_time_utc >= ? AND g.date_time_utc < ?
+"""
+
+# Team points (by team_id) for every game in a date_time_utc range
+_SCORES_SQL = """
+    SELECT tb.game_id, tb.team_id, tb.pts
+    FROM TeamBox tb
+    JOIN Games g ON tb.game_id = g.game_id
+    WHERE g.date_time_utc >= ? AND g.date_time_utc < ?
+"""
+
+# Final games before a date, oldest first
+_TEAM_LOGS_SQL = """
+    SELECT game_date, home, away, home_score, away_score
+    FROM GameStates
+    WHERE is_final_state = 1
+      AND game_date < ?
+    ORDER BY game_date
+"""
+
+Game = namedtuple('Game', ['game_id', 'home_team', 'away_team', 'game_date'])
+
 
 def safe_print(text):
     try:
@@ -35,289 +81,398 @@ def safe_print(text):
         print(text.encode('ascii', 'replace').decode('ascii'))
 
 
-def get_vegas_line(game_id, conn):
-    """Get Vegas spread (home team perspective)."""
-    result = conn.execute("""
-        SELECT espn_current_spread, espn_closing_spread, covers_closing_spread
-        FROM Betting WHERE game_id = ?
-    """, (game_id,)).fetchone()
+def load_vegas_lines(start_date, end_date, conn):
+    """
+    Get Vegas spreads (home team perspective) for every game in the range.
+
+    Returns:
+        dict of game_id -> spread (None if no line was posted)
+    """
+    rows = conn.execute(_VEGAS_SQL, utc_date_range(start_date, end_date)).fetchall()
+
+    return {game_id: current or closing or covers for game_id, current, closing, covers in rows}
 
-    if not result:
-        return None
-    return result[0] or result[1] or result[2]
 
+def load_team_scores(start_date, end_date, conn):
+    """
+    Get final points from TeamBox for every game in the range.
+
+    Returns:
+        dict of game_id -> {team abbreviation: pts}
+    """
+    team_abbrevs = dict(conn.execute("SELECT team_id, abbreviation FROM Teams").fetchall())
+    rows = conn.execute(_SCORES_SQL, utc_date_range(start_date, end_date)).fetchall()
+
+    scores = defaultdict(dict)
+    for game_id, team_id, pts in rows:
+        team = team_abbrevs.get(team_id)
+        if team is not None:
+            scores[game_id].setdefault(team, pts)
+    return scores
 
-def get_game_result(game_id, home_team, away_team, conn):
+
+def get_game_result(game_id, home_team, away_team, scores):
     """Get actual game result - who covered the spread."""
-    # Get scores from TeamBox
-    home_score = conn.execute("""
-        SELECT tb.pts FROM TeamBox tb
-        JOIN Teams t ON tb.team_id = t.team_id
-        WHERE tb.game_id = ? AND t.abbreviation = ?
-    """, (game_id, home_team)).fetchone()
-
-    away_score = conn.execute("""
-        SELECT tb.pts FROM TeamBox tb
-        JOIN Teams t ON tb.team_id = t.team_id
-        WHERE tb.game_id = ? AND t.abbreviation = ?
-    """, (game_id, away_team)).fetchone()
-
-    if not home_score or not away_score:
+    team_scores = scores.get(game_id, {})
+    if home_team not in team_scores or away_team not in team_scores:
         return None
 
+    home_score = team_scores[home_team]
+    away_score = team_scores[away_team]
     return {
-        'home_score': home_score[0],
-        'away_score': away_score[0],
-        'margin': home_score[0] - away_score[0]  # positive = home won by this much
+        'home_score': home_score,
+        'away_score': away_score,
+        'margin': home_score - away_score  # positive = home won by this much
     }
 
 
-def generate_prediction(home_team, away_team, game_date, game_id, conn):
+def running_totals(values):
     """
-    Generate prediction using EXACT same logic as daily_predictions.py
+    Prefix sums of a score array plus prefix counts of its missing (NaN) entries.
+
+    NaNs are kept out of the sums and counted separately, so a missing score
+    only blanks the windows that contain it. Both arrays have a leading 0.
     """
-    # Get recent games (data available BEFORE this game)
-    home_games = get_team_recent_games(home_team, game_date, conn, limit=10)
-    away_games = get_team_recent_games(away_team, game_date, conn, limit=10)
+    missing = np.isnan(values)
+    return (
+        np.concatenate(([0], np.cumsum(np.where(missing, 0, values)))),
+        np.concatenate(([0], np.cumsum(missing))),
+    )
 
-    if len(home_games) < 3 or len(away_games) < 3:
-        return None
 
-    # Calculate stats
-    home_stats = calculate_team_stats(home_games, home_team)
-    away_stats = calculate_team_stats(away_games, away_team)
+def load_team_game_logs(end_date, conn):
+    """
+    Load every final game before end_date in one query and precompute each
+    team's running points for/against.
+
+    Returns:
+        dict of team -> (sorted game dates, cumulative points, cumulative missing
+        points, cumulative opponent points, cumulative missing opponent points);
+        the cumulative arrays have a leading 0 so entry i is the total over the
+        first i games
+    """
+    rows = conn.execute(_TEAM_LOGS_SQL, (end_date,)).fetchall()
+    if not rows:
+        return {}
+
+    dates, home, away, home_score, away_score = (np.array(col, dtype=object) for col in zip(*rows))
+    # NULL scores come back as None; as floats they become NaN
+    home_score = home_score.astype(float)
+    away_score = away_score.astype(float)
+
+    logs = {}
+    for team in pd.unique(np.concatenate([home, away])):
+        is_home = home == team
+        played = is_home | (away == team)
+        points = np.where(is_home, home_score, away_score)[played]
+        opp_points = np.where(is_home, away_score, home_score)[played]
+        logs[team] = (dates[played], *running_totals(points), *running_totals(opp_points))
+    return logs
+
+
+def get_team_stats(team_logs, team, before_date, limit=10):
+    """
+    PPG and OPP_PPG over a team's last `limit` games before a date.
 
-    if not home_stats or not away_stats:
+    Same values as calculate_team_stats(get_team_recent_games(...)), read from
+    the precomputed running totals instead of recomputed per game. As there,
+    a window containing a game with a missing score averages to NaN.
+
+    Returns:
+        dict with keys: PPG, OPP_PPG, games_count, or None if no prior games
+    """
+    if team not in team_logs:
         return None
 
-    # Predict scores with 2% home court advantage (same as daily_predictions.py)
-    home_predicted = (home_stats['PPG'] * 1.02 + away_stats['OPP_PPG']) / 2
-    away_predicted = (away_stats['PPG'] + home_stats['OPP_PPG']) / 2
+    dates, cum_points, cum_missing, cum_opp_points, cum_opp_missing = team_logs[team]
+    end = int(np.searchsorted(dates, before_date, side='left'))
+    start = max(0, end - limit)
+    games_count = end - start
+    if games_count == 0:
+        return None
 
-    margin = home_predicted - away_predicted
+    def window_mean(cum_values, cum_missing):
+        if cum_missing[end] - cum_missing[start]:
+            return np.nan
+        return (cum_values[end] - cum_values[start]) / games_count
 
-    # Get rest/B2B info
-    rest_adjustment = 0
-    home_is_b2b = False
-    away_is_b2b = False
+    return {
+        'PPG': window_mean(cum_points, cum_missing),
+        'OPP_PPG': window_mean(cum_opp_points, cum_opp_missing),
+        'games_count': games_count,
+    }
 
-    try:
-        home_rest_info = get_team_rest_info(home_team, game_date, conn)
-        away_rest_info = get_team_rest_info(away_team, game_date, conn)
-        rest_adjustment, _ = calculate_rest_adjustment(home_rest_info, away_rest_info)
-        home_is_b2b = home_rest_info['is_b2b']
-        away_is_b2b = away_rest_info['is_b2b']
-    except:
-        pass
 
-    # Adjusted margin (injury disabled, so just rest)
-    adjusted_margin = margin + rest_adjustment
+def get_game_inputs(home_team, away_team, game_date, team_logs, rest_info):
+    """
+    Gather model inputs for a game using EXACT same data as daily_predictions.py
 
-    # Determine favorite and spread
-    favorite = home_team if adjusted_margin > 0 else away_team
-    spread = abs(adjusted_margin)
+    Returns:
+        dict with home/away PPG and OPP_PPG, rest_adjustment and B2B flags,
+        or None if either team has fewer than 3 prior games
+    """
+    # Stats over the last 10 games (data available BEFORE this game)
+    home_stats = get_team_stats(team_logs, home_team, game_date, limit=10)
+    away_stats = get_team_stats(team_logs, away_team, game_date, limit=10)
+
+    if not home_stats or not away_stats:
+        return None
 
-    # Get Vegas line
-    vegas_spread = get_vegas_line(game_id, conn)
+    if home_stats['games_count'] < 3 or away_stats['games_count'] < 3:
+        return None
+
+    # Get rest/B2B info
+    home_rest_info = rest_info[(home_team, game_date)]
+    away_rest_info = rest_info[(away_team, game_date)]
+    rest_adjustment, _ = calculate_rest_adjustment(home_rest_info, away_rest_info)
 
     return {
-        'home_team': home_team,
-        'away_team': away_team,
-        'game_date': game_date,
-        'game_id': game_id,
-        'favorite': favorite,
-        'spread': spread,
-        'home_is_b2b': home_is_b2b,
-        'away_is_b2b': away_is_b2b,
-        'vegas_spread': vegas_spread,
-        'injury_adjustment': 0,  # Always 0 (disabled)
+        'home_ppg': home_stats['PPG'],
+        'home_opp_ppg': home_stats['OPP_PPG'],
+        'away_ppg': away_stats['PPG'],
+        'away_opp_ppg': away_stats['OPP_PPG'],
+        'rest_adjustment': rest_adjustment,
+        'home_is_b2b': home_rest_info['is_b2b'],
+        'away_is_b2b': away_rest_info['is_b2b'],
     }
 
 
-def calculate_flag_score(pred):
-    """Calculate flag score (same as flag_system.py)."""
-    score = 0
+def predict_spreads(home_ppg, home_opp_ppg, away_ppg, away_opp_ppg, rest_adjustment, actual_margin):
+    """
+    Model spread and cover result for every game at once (same math as daily_predictions.py).
 
-    # injury_adj == 0 gives +5 (always true since disabled)
-    if abs(pred.get('injury_adjustment', 0)) == 0:
-        score += 5
+    All arguments are equal-length numpy arrays, one entry per game.
 
-    # Small spread < 3 gives +3
-    if pred['spread'] < 3:
-        score += 3
+    Returns:
+        Tuple of (fav_is_home, spread, covered) arrays
+    """
+    # Ops are applied in place on two buffers (same order as the scalar math,
+    # so results are bit-identical) instead of allocating a temporary per step
 
-    # B2B gives +3
-    if pred['home_is_b2b'] or pred['away_is_b2b']:
-        score += 3
+    # Predict scores with 2% home court advantage (same as daily_predictions.py)
+    adjusted_margin = np.multiply(home_ppg, 1.02, dtype=float)
+    adjusted_margin += away_opp_ppg
+    adjusted_margin /= 2
+    away_predicted = np.add(away_ppg, home_opp_ppg, dtype=float)
+    away_predicted /= 2
 
-    return score
+    # Adjusted margin (injury disabled, so just rest)
+    adjusted_margin -= away_predicted
+    adjusted_margin += rest_adjustment
 
+    # Favorite and spread
+    fav_is_home = adjusted_margin > 0
+    spread = np.abs(adjusted_margin, out=away_predicted)
 
-def categorize_game(pred):
-    """Categorize into GREEN/YELLOW/RED (same as flag_system.py)."""
-    flag_score = calculate_flag_score(pred)
+    # Our pick is the favorite at -spread: it covers by winning by more than the spread
+    covered = np.where(fav_is_home, actual_margin, -actual_margin) > spread
 
-    if flag_score >= 8:
-        return "GREEN"
-    elif flag_score >= 5:
-        return "YELLOW"
-    else:
-        return "RED"
+    return fav_is_home, spread, covered
 
 
-def check_if_covered(pred, result, conn):
+def calculate_flag_scores(spread, is_b2b):
     """
-    Check if our pick covered the spread.
+    Flag score and zone for every game (same as flag_system.py).
 
-    Our pick is: bet on pred['favorite'] at -pred['spread']
+    Returns:
+        Tuple of (flag_score, zone) arrays
     """
-    if not result:
-        return None
+    # injury_adj == 0 gives +5 (always true since disabled),
+    # small spread < 3 gives +3, B2B gives +3
+    flag_score = 5 + np.where(spread < 3, 3, 0) + np.where(is_b2b, 3, 0)
+    zone = np.select([flag_score >= 8, flag_score >= 5], ["GREEN", "YELLOW"], default="RED")
+    return flag_score, zone
 
-    actual_margin = result['margin']  # positive = home won
 
-    # Determine if we're backing home or away
-    if pred['favorite'] == pred['home_team']:
-        # We're backing home at -spread
-        # Home covers if: actual_margin > -spread (they win by more than spread, or lose by less)
-        # Wait, spread is positive. If home is favorite by 5, spread = 5
-        # We bet home -5. They need to win by >5 to cover.
-        covered = actual_margin > pred['spread']
-    else:
-        # We're backing away at -spread
-        # Away covers if: -actual_margin > spread (they win by more than spread)
-        # If away is favorite by 5, spread = 5, they need to win by >5
-        covered = -actual_margin > pred['spread']
-
-    return covered
+def check_vs_vegas(fav_is_home, vegas_spread, actual_margin):
+    """
+    Check if betting the model's side vs Vegas would have won, for every game.
 
+    vegas_spread is from the home perspective (negative = home favored) and
+    NaN where no line was posted.
 
-def check_vs_vegas(pred, result):
+    Returns:
+        Object array of True/False, None where there is no Vegas line
     """
-    Check if betting the model's side vs Vegas would have won.
+    # Home covers if: actual_margin + vegas_spread > 0
+    # (e.g., Vegas -3, home wins by 5: 5 + (-3) = 2 > 0, covered)
+    home_covered_vegas = actual_margin + vegas_spread > 0
+    our_pick_covered = (home_covered_vegas == fav_is_home).astype(object)
+    our_pick_covered[np.isnan(vegas_spread)] = None
+    return our_pick_covered
 
-    If Vegas has home -3 and we predict home -5, we agree on home.
-    If Vegas has home -3 and we predict away -1, we disagree.
+
+def print_backtest_header(start_date, end_date):
+    safe_print(f"\n{'='*80}")
+    safe_print(f"AXIOM DAILY PIPELINE BACKTEST")
+    safe_print(f"Date Range: {start_date} to {end_date}")
+    safe_print(f"{'='*80}\n")
+
+
+def run_backtest(start_date, end_date, conn):
+    """Run backtest over date range."""
+    print_backtest_header(start_date, end_date)
+
+    games_in_range, df = backtest_date_range(start_date, end_date, conn)
+    safe_print(f"Games in range: {games_in_range}")
+    return df
+
+
+def _backtest_chunk(db_path, start_date, end_date):
+    """Worker for run_backtest_parallel: backtest one date chunk on its own connection."""
+    conn = open_db(db_path, read_only=True)
+    try:
+        return backtest_date_range(start_date, end_date, conn)
+    finally:
+        conn.close()
+
+
+def run_backtest_parallel(start_date, end_date, db_path, workers):
     """
-    if not result or pred['vegas_spread'] is None:
-        return None, None
+    Run backtest over date range split into `workers` date chunks, one process each.
 
-    vegas_spread = pred['vegas_spread']  # Home perspective (negative = home favored)
-    actual_margin = result['margin']
+    Every game only depends on data from before its own date, so the chunks are
+    independent and the combined result matches run_backtest.
+    """
+    print_backtest_header(start_date, end_date)
 
-    # Determine our pick vs Vegas
-    model_favors_home = pred['favorite'] == pred['home_team']
-    vegas_favors_home = vegas_spread < 0
+    first = datetime.strptime(start_date, '%Y-%m-%d')
+    total_days = (datetime.strptime(end_date, '%Y-%m-%d') - first).days + 1
+    if total_days <= 0:
+        # End before start: no games, same as run_backtest
+        safe_print("Games in range: 0")
+        return pd.DataFrame()
 
-    # Calculate if home covered Vegas spread
-    # Home covers if: actual_margin + vegas_spread > 0
-    # (e.g., Vegas -3, home wins by 5: 5 + (-3) = 2 > 0, covered)
-    home_covered_vegas = actual_margin + vegas_spread > 0
+    chunk_days = -(-total_days // workers)
+    chunks = [
+        ((first + timedelta(days=offset)).strftime('%Y-%m-%d'),
+         (first + timedelta(days=min(offset + chunk_days, total_days) - 1)).strftime('%Y-%m-%d'))
+        for offset in range(0, total_days, chunk_days)
+    ]
 
-    # Our pick result
-    if model_favors_home:
-        our_pick_covered = home_covered_vegas
-    else:
-        our_pick_covered = not home_covered_vegas
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        chunk_results = list(pool.map(_backtest_chunk, repeat(db_path), *zip(*chunks)))
 
-    # Edge (how much we disagreed with Vegas)
-    if model_favors_home:
-        model_spread_vs_vegas = pred['spread'] - abs(vegas_spread) if vegas_favors_home else pred['spread'] + abs(vegas_spread)
-    else:
-        model_spread_vs_vegas = pred['spread'] - abs(vegas_spread) if not vegas_favors_home else pred['spread'] + abs(vegas_spread)
+    safe_print(f"Games in range: {sum(games_in_range for games_in_range, _ in chunk_results)}")
 
-    return our_pick_covered, model_spread_vs_vegas
+    frames = [df for _, df in chunk_results if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
 
 
-def run_backtest(start_date, end_date, conn):
-    """Run backtest over date range."""
-    safe_print(f"\n{'='*80}")
-    safe_print(f"AXIOM DAILY PIPELINE BACKTEST")
-    safe_print(f"Date Range: {start_date} to {end_date}")
-    safe_print(f"{'='*80}\n")
+def backtest_date_range(start_date, end_date, conn):
+    """
+    Backtest every game in a date range.
 
+    Returns:
+        Tuple of (number of games in range, DataFrame with one row per scored bet)
+    """
     # Get all games in range with results
-    games_df = pd.read_sql("""
-        SELECT g.game_id, g.home_team, g.away_team, DATE(g.date_time_utc) as game_date
-        FROM Games g
-        JOIN Betting b ON g.game_id = b.game_id
-        WHERE DATE(g.date_time_utc) BETWEEN ? AND ?
-          AND g.season = '2025-2026'
-        ORDER BY g.date_time_utc
-    """, conn, params=(start_date, end_date))
-
-    safe_print(f"Games in range: {len(games_df)}")
-
-    # Track results
-    all_bets = []
-
-    for _, game in games_df.iterrows():
-        # Generate prediction
-        pred = generate_prediction(
-            game['home_team'],
-            game['away_team'],
-            game['game_date'],
-            game['game_id'],
-            conn
+    game_rows = [Game._make(row) for row in conn.execute(_GAMES_SQL, utc_date_range(start_date, end_date))]
+
+    # Gather model inputs and results game by game; the prediction math then
+    # runs over all games at once
+    team_logs = load_team_game_logs(end_date, conn)
+    scores = load_team_scores(start_date, end_date, conn)
+    vegas_lines = load_vegas_lines(start_date, end_date, conn)
+    rest_info = get_team_rest_info_batch(
+        [(team, game.game_date) for game in game_rows
+         for team in (game.home_team, game.away_team)],
+        conn
+    )
+
+    games = []
+    inputs = []
+    vegas_spreads = []
+    results = []
+
+    for game in game_rows:
+        game_inputs = get_game_inputs(
+            game.home_team,
+            game.away_team,
+            game.game_date,
+            team_logs,
+            rest_info
         )
 
-        if not pred:
+        if not game_inputs:
             continue
 
         # Get actual result
         result = get_game_result(
-            game['game_id'],
-            game['home_team'],
-            game['away_team'],
-            conn
+            game.game_id,
+            game.home_team,
+            game.away_team,
+            scores
         )
 
         if not result:
             continue
 
-        # Categorize
-        zone = categorize_game(pred)
-        flag_score = calculate_flag_score(pred)
-
-        # Check if covered
-        covered = check_if_covered(pred, result, conn)
-        covered_vs_vegas, edge = check_vs_vegas(pred, result)
-
-        # Determine flags
-        is_small_spread = pred['spread'] < 3
-        is_b2b = pred['home_is_b2b'] or pred['away_is_b2b']
-
-        # Which team on B2B
-        b2b_team = None
-        if pred['home_is_b2b']:
-            b2b_team = pred['home_team']
-        elif pred['away_is_b2b']:
-            b2b_team = pred['away_team']
-
-        # Is our pick fading the B2B team?
-        fading_b2b = False
-        if b2b_team:
-            fading_b2b = pred['favorite'] != b2b_team
-
-        all_bets.append({
-            'game_date': game['game_date'],
-            'game': f"{game['away_team']} @ {game['home_team']}",
-            'pick': f"{pred['favorite']} -{pred['spread']:.1f}",
-            'zone': zone,
-            'flag_score': flag_score,
-            'spread': pred['spread'],
-            'is_small_spread': is_small_spread,
-            'is_b2b': is_b2b,
-            'fading_b2b': fading_b2b,
-            'covered': covered,
-            'covered_vs_vegas': covered_vs_vegas,
-            'vegas_spread': pred['vegas_spread'],
-            'actual_margin': result['margin'],
-            'home_score': result['home_score'],
-            'away_score': result['away_score'],
-        })
+        games.append(game)
+        inputs.append(game_inputs)
+        vegas_spreads.append(vegas_lines.get(game.game_id))
+        results.append(result)
+
+    if not games:
+        return len(game_rows), pd.DataFrame()
+
+    def column(rows, key):
+        return np.array([row[key] for row in rows])
+
+    actual_margin = column(results, 'margin')
+    fav_is_home, spreads, covered_arr = predict_spreads(
+        column(inputs, 'home_ppg'),
+        column(inputs, 'home_opp_ppg'),
+        column(inputs, 'away_ppg'),
+        column(inputs, 'away_opp_ppg'),
+        column(inputs, 'rest_adjustment'),
+        actual_margin,
+    )
+
+    home_team = np.array([game.home_team for game in games])
+    away_team = np.array([game.away_team for game in games])
+    favorite = np.where(fav_is_home, home_team, away_team)
+    home_is_b2b = column(inputs, 'home_is_b2b').astype(bool)
+    away_is_b2b = column(inputs, 'away_is_b2b').astype(bool)
+    is_b2b = home_is_b2b | away_is_b2b
+    vegas_spread = np.array([np.nan if v is None else v for v in vegas_spreads], dtype=float)
+
+    flag_score, zone = calculate_flag_scores(spreads, is_b2b)
+
+    # Is our pick fading the B2B team? (home team counts first if both are on a B2B)
+    fading_b2b = np.where(home_is_b2b, ~fav_is_home, away_is_b2b & fav_is_home)
+
+    return len(game_rows), pd.DataFrame({
+        'game_date': [game.game_date for game in games],
+        'game': np.char.add(np.char.add(away_team, ' @ '), home_team).astype(object),
+        'pick': np.char.add(np.char.add(favorite, ' -'), np.char.mod('%.1f', spreads)).astype(object),
+        'zone': zone.astype(object),
+        'flag_score': flag_score,
+        'spread': spreads,
+        'is_small_spread': spreads < 3,
+        'is_b2b': is_b2b,
+        'fading_b2b': fading_b2b,
+        'covered': covered_arr,
+        'covered_vs_vegas': check_vs_vegas(fav_is_home, vegas_spread, actual_margin),
+        'vegas_spread': vegas_spread,
+        'actual_margin': actual_margin,
+        'home_score': column(results, 'home_score'),
+        'away_score': column(results, 'away_score'),
+    })
 
-    return pd.DataFrame(all_bets)
+
+def group_win_stats(df, by, col='covered'):
+    """
+    Bets, wins and win% for every group of `by` in a single groupby pass.
+
+    Returns:
+        DataFrame indexed by group with columns: bets, wins, win_pct
+    """
+    stats = df.groupby(by, observed=True)[col].agg(bets='size', wins='sum', win_pct='mean')
+    stats['win_pct'] *= 100
+    return stats
 
 
 def generate_report(df, output_path=None):
@@ -347,69 +502,54 @@ def generate_report(df, output_path=None):
     safe_print("RESULTS BY ZONE")
     safe_print(f"{'='*80}")
 
-    for zone in ['GREEN', 'YELLOW', 'RED']:
-        zone_df = df[df['zone'] == zone]
-        if len(zone_df) > 0:
-            win_pct = zone_df['covered'].mean() * 100
-            results.append({
-                'Category': 'BY ZONE',
-                'Subcategory': zone,
-                'Bets': len(zone_df),
-                'Wins': zone_df['covered'].sum(),
-                'Win%': round(win_pct, 1),
-                'Edge': round(win_pct - 50, 1)
-            })
-            safe_print(f"{zone}: {zone_df['covered'].sum()}-{len(zone_df) - zone_df['covered'].sum()} ({win_pct:.1f}%)")
+    zone_stats = group_win_stats(df, 'zone').reindex(['GREEN', 'YELLOW', 'RED']).dropna()
+    for zone, bets, wins, win_pct in zone_stats.itertuples():
+        bets, wins = int(bets), int(wins)
+        results.append({
+            'Category': 'BY ZONE',
+            'Subcategory': zone,
+            'Bets': bets,
+            'Wins': wins,
+            'Win%': round(win_pct, 1),
+            'Edge': round(win_pct - 50, 1)
+        })
+        safe_print(f"{zone}: {wins}-{bets - wins} ({win_pct:.1f}%)")
 
     # By Flag Score
     safe_print(f"\n{'='*80}")
     safe_print("RESULTS BY FLAG SCORE")
     safe_print(f"{'='*80}")
 
-    for score in sorted(df['flag_score'].unique()):
-        score_df = df[df['flag_score'] == score]
-        if len(score_df) >= 5:
-            win_pct = score_df['covered'].mean() * 100
-            results.append({
-                'Category': 'BY FLAG SCORE',
-                'Subcategory': f'Score {score}',
-                'Bets': len(score_df),
-                'Wins': score_df['covered'].sum(),
-                'Win%': round(win_pct, 1),
-                'Edge': round(win_pct - 50, 1)
-            })
-            safe_print(f"Flag {score}: {score_df['covered'].sum()}-{len(score_df) - score_df['covered'].sum()} ({win_pct:.1f}%)")
+    score_stats = group_win_stats(df, 'flag_score')
+    for score, bets, wins, win_pct in score_stats[score_stats['bets'] >= 5].itertuples():
+        results.append({
+            'Category': 'BY FLAG SCORE',
+            'Subcategory': f'Score {score}',
+            'Bets': bets,
+            'Wins': wins,
+            'Win%': round(win_pct, 1),
+            'Edge': round(win_pct - 50, 1)
+        })
+        safe_print(f"Flag {score}: {wins}-{bets - wins} ({win_pct:.1f}%)")
 
     # Small Spread Analysis
     safe_print(f"\n{'='*80}")
     safe_print("SMALL SPREAD ANALYSIS (< 3 points)")
     safe_print(f"{'='*80}")
 
-    small_df = df[df['is_small_spread']]
-    if len(small_df) > 0:
-        win_pct = small_df['covered'].mean() * 100
+    spread_bands = pd.cut(df['spread'], bins=[-np.inf, 3, np.inf], right=False,
+                          labels=['Small Spread (<3)', 'Large Spread (>=3)'])
+    band_labels = {'Small Spread (<3)': 'Small (<3)', 'Large Spread (>=3)': 'Large (>=3)'}
+    for band, bets, wins, win_pct in group_win_stats(df, spread_bands).itertuples():
         results.append({
             'Category': 'SPREAD SIZE',
-            'Subcategory': 'Small Spread (<3)',
-            'Bets': len(small_df),
-            'Wins': small_df['covered'].sum(),
+            'Subcategory': band,
+            'Bets': bets,
+            'Wins': wins,
             'Win%': round(win_pct, 1),
             'Edge': round(win_pct - 50, 1)
         })
-        safe_print(f"Small (<3): {small_df['covered'].sum()}-{len(small_df) - small_df['covered'].sum()} ({win_pct:.1f}%)")
-
-    large_df = df[~df['is_small_spread']]
-    if len(large_df) > 0:
-        win_pct = large_df['covered'].mean() * 100
-        results.append({
-            'Category': 'SPREAD SIZE',
-            'Subcategory': 'Large Spread (>=3)',
-            'Bets': len(large_df),
-            'Wins': large_df['covered'].sum(),
-            'Win%': round(win_pct, 1),
-            'Edge': round(win_pct - 50, 1)
-        })
-        safe_print(f"Large (>=3): {large_df['covered'].sum()}-{len(large_df) - large_df['covered'].sum()} ({win_pct:.1f}%)")
+        safe_print(f"{band_labels[band]}: {wins}-{bets - wins} ({win_pct:.1f}%)")
 
     # B2B Analysis
     safe_print(f"\n{'='*80}")
@@ -514,16 +654,16 @@ def generate_report(df, output_path=None):
     safe_print("FULL RESULTS TABLE")
     safe_print(f"{'='*80}")
 
-    for category in results_df['Category'].unique():
-        cat_df = results_df[results_df['Category'] == category]
+    for category, cat_df in results_df.groupby('Category', sort=False):
         safe_print(f"\n### {category}")
         safe_print("-" * 70)
         safe_print(f"{'Subcategory':<30} {'Bets':>8} {'Wins':>8} {'Win%':>8} {'Edge':>8}")
         safe_print("-" * 70)
 
-        for _, row in cat_df.iterrows():
-            edge_str = f"+{row['Edge']}" if row['Edge'] > 0 else str(row['Edge'])
-            safe_print(f"{row['Subcategory']:<30} {row['Bets']:>8} {row['Wins']:>8} {row['Win%']:>7.1f}% {edge_str:>7}%")
+        rows = cat_df[['Subcategory', 'Bets', 'Wins', 'Win%', 'Edge']].to_numpy()
+        for subcategory, bets, wins, win_pct, edge in rows:
+            edge_str = f"+{edge}" if edge > 0 else str(edge)
+            safe_print(f"{subcategory:<30} {bets:>8} {wins:>8} {win_pct:>7.1f}% {edge_str:>7}%")
 
     # Save outputs
     if output_path:
@@ -546,17 +686,25 @@ def main():
                         help="End date (YYYY-MM-DD)")
     parser.add_argument("--output", "-o", type=str, default="outputs/pipeline_backtest.csv",
                         help="Output CSV path")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Split the date range across this many processes (default: 1)")
     args = parser.parse_args()
 
-    conn = sqlite3.connect(DB_PATH)
+    # Index creation needs a writable connection; the backtest itself reads only
+    index_conn = open_db(DB_PATH)
+    ensure_indexes(index_conn, BACKTEST_INDEXES)
+    index_conn.close()
 
     # Run backtest
-    df = run_backtest(args.start, args.end, conn)
+    if args.workers > 1:
+        df = run_backtest_parallel(args.start, args.end, DB_PATH, args.workers)
+    else:
+        conn = open_db(DB_PATH, read_only=True)
+        df = run_backtest(args.start, args.end, conn)
+        conn.close()
 
     # Generate report
     generate_report(df, args.output)
-
-    conn.close()
     return 0
 
 
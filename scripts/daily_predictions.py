@@ -22,7 +22,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 import requests
 
 # Add project root to path
@@ -34,10 +33,16 @@ from scripts.injury_impact import get_game_injury_adjustment, format_injury_summ
 from scripts.rest_detection import get_team_rest_info, calculate_rest_adjustment, format_rest_summary
 from scripts.flag_system import generate_ai_review_file
 from scripts.shared_utils import get_team_recent_games, calculate_team_stats
+from scripts.db_utils import ensure_indexes, utc_date_range
 
 DB_PATH = config["database"]["path"]
 DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "outputs"
 
+# Indexes for the slate lookup (range scan on date_time_utc)
+PREDICTION_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_games_date_time ON Games(date_time_utc)",
+)
+
 
 def get_vegas_line(game_id, conn):
     """Get Vegas line from Betting table.
@@ -215,14 +220,16 @@ def generate_prediction(home_team, away_team, home_stats, away_stats, game_statu
 
 
 def get_todays_games(target_date, conn):
-    """Get all games for a specific date."""
+    """Get all games for a specific date as sqlite3.Row records (a slate is ~15 rows)."""
     query = '''
         SELECT game_id, home_team, away_team, date_time_utc, status_text
         FROM Games
-        WHERE DATE(date_time_utc) = ?
+        WHERE date_time_utc >= ? AND date_time_utc < ?
         ORDER BY date_time_utc
     '''
-    return pd.read_sql(query, conn, params=(target_date,))
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    return cursor.execute(query, utc_date_range(target_date)).fetchall()
 
 
 def send_discord_webhook(webhook_url, predictions, target_date, min_confidence=0.0):
@@ -295,21 +302,22 @@ def generate_daily_predictions(target_date=None, output_dir=None, min_confidence
     output_dir.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(DB_PATH)
+    ensure_indexes(conn, PREDICTION_INDEXES)
 
     # Get today's games
-    games_df = get_todays_games(target_date, conn)
+    games = get_todays_games(target_date, conn)
 
-    if len(games_df) == 0:
+    if not games:
         print(f"No games found for {target_date}")
         conn.close()
         return None
 
-    print(f"Found {len(games_df)} games for {target_date}")
+    print(f"Found {len(games)} games for {target_date}")
 
     predictions = []
     skipped = []
 
-    for _, game in games_df.iterrows():
+    for game in games:
         home = game['home_team']
         away = game['away_team']
         game_date = game['date_time_utc'][:10]
@@ -358,7 +366,7 @@ def generate_daily_predictions(target_date=None, output_dir=None, min_confidence
         json.dump({
             'date': target_date,
             'generated_at': datetime.now(timezone.utc).isoformat(),
-            'total_games': len(games_df),
+            'total_games': len(games),
             'predictions_count': len(predictions),
             'skipped_count': len(skipped),
             'predictions': predictions,
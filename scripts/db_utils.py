@@ -0,0 +1,91 @@
+"""
+SQLite connection helpers for AXIOM scripts.
+
+Read-only analytics (backtests, reports) open the database through a
+``mode=ro`` URI so SQLite skips journal setup, and get a larger page cache
+and memory map so repeated scans stay in memory. Read-write connections use
+WAL with a busy timeout so a writer doesn't block (or crash) readers running
+at the same time.
+"""
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+
+# Pragmas for read-only analytics connections
+READ_PRAGMAS = (
+    "PRAGMA mmap_size=536870912",   # 512 MB memory map
+    "PRAGMA cache_size=-131072",    # 128 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA threads=4",             # helper threads for large sorts
+    "PRAGMA query_only=1",
+)
+
+# Pragmas for read-write connections
+WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def open_db(db_path, read_only=False, row_factory=None):
+    """
+    Open a SQLite connection to the AXIOM database.
+
+    Args:
+        db_path: Path to the SQLite file
+        read_only: Open with mode=ro and read-tuned pragmas (default False)
+        row_factory: Optional row factory, e.g. sqlite3.Row
+
+    Returns:
+        sqlite3.Connection
+    """
+    if read_only:
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        pragmas = READ_PRAGMAS
+    else:
+        conn = sqlite3.connect(db_path)
+        pragmas = WRITE_PRAGMAS
+
+    for pragma in pragmas:
+        conn.execute(pragma)
+    if row_factory is not None:
+        conn.row_factory = row_factory
+    return conn
+
+
+def ensure_indexes(conn, indexes):
+    """
+    Create the indexes a script's hot queries rely on, if they don't exist.
+
+    Indexes on tables that aren't in this database yet are skipped. Runs
+    PRAGMA optimize afterwards so the planner has statistics for new indexes.
+
+    Args:
+        conn: Read-write SQLite connection
+        indexes: Iterable of CREATE INDEX IF NOT EXISTS statements
+    """
+    with conn:
+        for statement in indexes:
+            try:
+                conn.execute(statement)
+            except sqlite3.OperationalError as e:
+                if "no such table" not in str(e):
+                    raise
+    conn.execute("PRAGMA optimize")
+
+
+def utc_date_range(start_day, end_day=None):
+    """
+    Bounds for matching date_time_utc to calendar days with an index range scan.
+
+    ('YYYY-MM-DD', 'YYYY-MM-DD') -> (start_day, day after end_day), so
+    ``date_time_utc >= ? AND date_time_utc < ?`` matches the same rows as
+    ``DATE(date_time_utc) BETWEEN start_day AND end_day`` but can use an index
+    on date_time_utc. end_day defaults to start_day (a single day).
+    """
+    next_day = date.fromisoformat(end_day or start_day) + timedelta(days=1)
+    return start_day, next_day.isoformat()
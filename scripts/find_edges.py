@@ -21,8 +21,8 @@ Usage:
     python scripts/find_edges.py --test  # Test with sample data
 """
 import argparse
+import heapq
 import json
-import sqlite3
 import sys
 from datetime import date
 from pathlib import Path
@@ -34,15 +34,19 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
+from scripts.db_utils import ensure_indexes, open_db
 from scripts.project_props import (
+    PROJECTION_INDEXES,
     project_player_prop,
     get_player_position,
     get_dvp_adjustment,
     get_vs_opponent_avg,
     build_player_positions_table,
+    load_player_positions,
     STATS,
     STAT_COLS
 )
+from scripts.shared_utils import parse_prop_pick
 from scripts.props_validator import (
     validate_prop,
     get_valid_players_for_props,
@@ -169,26 +173,25 @@ def calculate_confidence(edge_pct, vs_opp_games, dvp_rank, season_games, stat=No
 
 def get_dvp_rank(opponent, position, stat, conn):
     """Get DVP rank for opponent vs position for stat."""
-    df = pd.read_sql("""
+    row = conn.execute("""
         SELECT rank FROM defense_vs_position
         WHERE team = ? AND position = ? AND stat = ?
-    """, conn, params=(opponent, position, stat))
+    """, (opponent, position, stat)).fetchone()
 
-    if df.empty:
+    if row is None:
         return None
-    return int(df.iloc[0]["rank"])
+    return int(row[0])
 
 
 def get_player_season_games(player_name, conn):
     """Get number of games player has played this season."""
-    df = pd.read_sql("""
+    return conn.execute("""
         SELECT COUNT(DISTINCT game_id) as games FROM PlayerBox
         WHERE player_name = ? AND min > 0
-    """, conn, params=(player_name,))
-    return df.iloc[0]["games"]
+    """, (player_name,)).fetchone()[0]
 
 
-def find_edge(player_name, opponent, stat, line, conn, target_date=None, validate=True):
+def find_edge(player_name, opponent, stat, line, conn, target_date=None, validate=True, position=None):
     """
     Find edge between our projection and the line.
 
@@ -200,6 +203,7 @@ def find_edge(player_name, opponent, stat, line, conn, target_date=None, validat
         conn: Database connection
         target_date: Date to validate against (None = today)
         validate: If True, validate player is playing on target_date
+        position: Player position, if already known (looked up when None)
 
     Returns:
         dict with edge details or None if no edge
@@ -211,7 +215,8 @@ def find_edge(player_name, opponent, stat, line, conn, target_date=None, validat
             return None
 
     # Get projection
-    position = get_player_position(player_name, conn)
+    if position is None:
+        position = get_player_position(player_name, conn)
     proj = project_player_prop(player_name, opponent, stat, conn, position)
 
     if proj is None:
@@ -349,37 +354,39 @@ def log_s_tier_props(edges, target_date, max_picks=5, conn=None):
         if filtered:
             print(f"[AUTO-LOG] Filtered out {filtered} bench player(s) (< 25 min avg)")
 
-    # Sort by edge% and take top picks
-    s_tier_high.sort(key=lambda x: abs(x.get('edge_pct', 0)), reverse=True)
-
-    # Get best prop per player (highest edge%), limited to max_picks unique players
+    # Best prop per player (highest edge%, earliest on ties), then the top
+    # max_picks players by that edge
     best_by_player = {}
-    for e in s_tier_high:
+    for i, e in enumerate(s_tier_high):
+        key = (abs(e.get('edge_pct', 0)), -i)
         player = e['player_name']
-        if player not in best_by_player:
-            best_by_player[player] = e
-        if len(best_by_player) >= max_picks:
-            break
-
-    # Check existing picks for this date to avoid duplicates
+        if player not in best_by_player or key > best_by_player[player][0]:
+            best_by_player[player] = (key, e)
+    top = heapq.nlargest(max_picks, best_by_player.values(), key=lambda item: item[0])
+    best_by_player = {e['player_name']: e for _, e in top}
+
+    # Check existing picks for this date to avoid duplicates. Keyed on
+    # (player, side, prop type) rather than the pick string, so a re-run after
+    # the line moves doesn't log the same prop a second time.
     existing = set()
     if RESULTS_CSV.exists():
         with open(RESULTS_CSV, 'r', newline='', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
                 if row['date'] == target_date and row['bet_type'] == 'PROP':
-                    existing.add(row['pick'])
+                    player, direction, _, stat = parse_prop_pick(row['pick'])
+                    existing.add((player, direction, stat))
 
     # Log new picks
     logged = 0
     rows_to_add = []
 
     for player, e in best_by_player.items():
-        pick_str = f"{e['player_name']} {e['pick']} {e['line']} {e['prop_type']}"
-
-        if pick_str in existing:
+        if (e['player_name'], e['pick'], e['prop_type']) in existing:
             continue
 
+        pick_str = f"{e['player_name']} {e['pick']} {e['line']} {e['prop_type']}"
+
         # Get game string
         game_str = f"vs {e['opponent']}"
 
@@ -482,6 +489,7 @@ def find_edges_for_today(conn, target_date=None, all_stats=False, min_games=20):
     print(f"Players with {min_games}+ games: {len(valid_players)}")
 
     build_player_positions_table(conn)
+    positions = load_player_positions(conn)
 
     # Sample lines for each player (in production, these come from sportsbook API)
     # For now, we use their season averages as proxy lines
@@ -492,7 +500,7 @@ def find_edges_for_today(conn, target_date=None, all_stats=False, min_games=20):
         opponent = player_info["opponent"]
 
         # Get player's season averages to use as proxy lines
-        position = get_player_position(player_name, conn)
+        position = positions.get(player_name, "SF")
 
         for stat in PROFITABLE_STATS if not all_stats else STATS:
             proj = project_player_prop(player_name, opponent, stat, conn, position)
@@ -502,7 +510,8 @@ def find_edges_for_today(conn, target_date=None, all_stats=False, min_games=20):
 
                 edge = find_edge(
                     player_name, opponent, stat, line, conn,
-                    target_date=target_date, validate=False  # Already validated
+                    target_date=target_date, validate=False,  # Already validated
+                    position=position
                 )
 
                 if edge and edge["confidence"] != "NONE":
@@ -609,8 +618,9 @@ def main():
 
     args = parser.parse_args()
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_db(DB_PATH)
     build_player_positions_table(conn)
+    ensure_indexes(conn, PROJECTION_INDEXES)
 
     if args.today:
         target_date = args.date or date.today().isoformat()
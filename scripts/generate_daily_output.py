@@ -11,17 +11,19 @@ Includes: Player Props, Spreads, ML, Totals
 import argparse
 import csv
 import json
-import sqlite3
 import sys
+from collections import Counter, defaultdict
 from datetime import date, datetime
 from pathlib import Path
 
+import numpy as np
+
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
 from scripts.find_edges import find_edges_for_today, get_stat_tier
-from scripts.props_validator import get_todays_games
+from scripts.db_utils import ensure_indexes, open_db, utc_date_range
 
 DB_PATH = config["database"]["path"]
 OUTPUTS_DIR = PROJECT_ROOT / "outputs"
@@ -36,6 +38,33 @@ for d in [PREDICTIONS_DIR, SOCIAL_DIR, PERFORMANCE_DIR]:
 # Minimum average minutes to be considered a "star" for social content
 MIN_STAR_MINUTES = 25
 
+# Indexes for the slate lookups (range scan on date_time_utc)
+OUTPUT_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_games_date_time ON Games(date_time_utc)",
+)
+
+# Today's games with their current lines and each team's latest ratings, in
+# schedule order; one query instead of a Betting and two TeamAdvancedStats
+# lookups per game
+_SPREAD_SLATE_SQL = '''
+    WITH ratings AS (
+        SELECT team_abbrev, off_rating, def_rating, pace,
+               ROW_NUMBER() OVER (PARTITION BY team_abbrev ORDER BY updated_at DESC) AS recency
+        FROM TeamAdvancedStats
+    )
+    SELECT g.away_team, g.home_team,
+           b.espn_current_spread, b.espn_current_total,
+           b.espn_current_ml_home, b.espn_current_ml_away,
+           h.off_rating, h.def_rating, h.pace,
+           a.off_rating, a.def_rating, a.pace
+    FROM Games g
+    LEFT JOIN Betting b ON b.game_id = g.game_id
+    LEFT JOIN ratings h ON h.team_abbrev = g.home_team AND h.recency = 1
+    LEFT JOIN ratings a ON a.team_abbrev = g.away_team AND a.recency = 1
+    WHERE g.date_time_utc >= ? AND g.date_time_utc < ?
+    ORDER BY g.date_time_utc, g.game_id
+'''
+
 # Human-readable stat names for output (social posts, Discord, web)
 STAT_DISPLAY = {
     'PRA': 'Pts+Reb+Ast', 'PA': 'Pts+Ast', 'RA': 'Reb+Ast',
@@ -59,9 +88,9 @@ def get_game_times(conn, target_date):
     rows = conn.execute('''
         SELECT away_team, home_team, date_time_utc
         FROM Games
-        WHERE DATE(date_time_utc) = ?
+        WHERE date_time_utc >= ? AND date_time_utc < ?
         ORDER BY date_time_utc
-    ''', (target_date,)).fetchall()
+    ''', utc_date_range(target_date)).fetchall()
 
     game_times = {}
     for away, home, utc_str in rows:
@@ -123,30 +152,18 @@ def fetch_betting_lines(conn, target_date):
 
 def get_spread_picks(conn, target_date):
     """Get spread/ML/total predictions for today's games."""
-    games = get_todays_games(conn, target_date)
+    rows = conn.execute(_SPREAD_SLATE_SQL, utc_date_range(target_date)).fetchall()
     picks = []
 
-    for game in games:
-        game_id = game.get('game_id')
-        away_team = game['away_team']
-        home_team = game['home_team']
-
-        # Get betting lines
-        line_data = conn.execute('''
-            SELECT espn_current_spread, espn_current_total,
-                   espn_current_ml_home, espn_current_ml_away
-            FROM Betting
-            WHERE game_id = ?
-        ''', (game_id,)).fetchone()
-
-        spread = line_data[0] if line_data and line_data[0] else None
-        total = line_data[1] if line_data and line_data[1] else None
-        ml_home = line_data[2] if line_data and line_data[2] else None
-        ml_away = line_data[3] if line_data and line_data[3] else None
+    for away_team, home_team, spread, total, ml_home, ml_away, *ratings in rows:
+        spread = spread or None
+        total = total or None
+        ml_home = ml_home or None
+        ml_away = ml_away or None
 
         # Get model prediction from daily_predictions logic
         # For now, use simple stats-based prediction
-        model_spread, model_total = get_model_prediction(conn, away_team, home_team)
+        model_spread, model_total = calculate_model_prediction(ratings[:3], ratings[3:])
 
         game_info = {
             'game': f"{away_team} @ {home_team}",
@@ -200,24 +217,12 @@ def get_spread_picks(conn, target_date):
     return picks
 
 
-def get_model_prediction(conn, away_team, home_team):
-    """Get model spread and total prediction based on team stats."""
-    # Get team offensive/defensive ratings
-    home_stats = conn.execute('''
-        SELECT off_rating, def_rating, pace
-        FROM TeamAdvancedStats
-        WHERE team_abbrev = ?
-        ORDER BY updated_at DESC LIMIT 1
-    ''', (home_team,)).fetchone()
-
-    away_stats = conn.execute('''
-        SELECT off_rating, def_rating, pace
-        FROM TeamAdvancedStats
-        WHERE team_abbrev = ?
-        ORDER BY updated_at DESC LIMIT 1
-    ''', (away_team,)).fetchone()
+def calculate_model_prediction(home_stats, away_stats):
+    """Model spread and total from (off_rating, def_rating, pace) for each team.
 
-    if not home_stats or not away_stats:
+    Returns (None, None) if either team's ratings are missing.
+    """
+    if None in home_stats or None in away_stats:
         return None, None
 
     home_off, home_def, home_pace = home_stats
@@ -603,21 +608,20 @@ def get_engagement_stats(conn, target_date, prop_picks, star_players=None):
     return deduped[:8]  # Return top 8 insights
 
 
-def generate_social_posts(conn, target_date, prop_picks, spread_picks):
+def generate_social_posts(conn, target_date, prop_picks, spread_picks, game_times=None):
     """Generate social media content - SILVER tier free, premium elsewhere.
 
     Only includes STAR players (25+ min avg) in engagement posts.
     """
     filepath = SOCIAL_DIR / f"posts_{target_date}.txt"
 
-    games = get_todays_games(conn, target_date)
-
     # Get star players for filtering
     star_players = get_star_players(conn)
     print(f"      Star players (25+ min avg): {len(star_players)}")
 
-    # Get game times for display
-    game_times = get_game_times(conn, target_date)
+    # Get game times for display (main already has them)
+    if game_times is None:
+        game_times = get_game_times(conn, target_date)
 
     content = []
 
@@ -738,7 +742,8 @@ def generate_social_posts(conn, target_date, prop_picks, spread_picks):
     content.append("=" * 60)
     content.append("")
 
-    for g in games[:3]:
+    # spread_picks has one entry per game on the slate, in schedule order
+    for g in spread_picks[:3]:
         away = g['away_team']
         home = g['home_team']
 
@@ -836,13 +841,18 @@ def generate_social_posts(conn, target_date, prop_picks, spread_picks):
 
 
 def calculate_roi(wins, losses):
-    """Calculate ROI assuming -110 standard juice."""
-    if wins + losses == 0:
-        return 0
+    """Calculate ROI assuming -110 standard juice.
+
+    Accepts scalars or arrays of records; returns a float or an array to match.
+    """
+    wins = np.asarray(wins, dtype=float)
+    losses = np.asarray(losses, dtype=float)
     # Win pays +100, loss costs -110
     profit = (wins * 100) - (losses * 110)
     total_risked = (wins + losses) * 110
-    return (profit / total_risked) * 100 if total_risked > 0 else 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi = np.where(total_risked > 0, profit / total_risked * 100, 0.0)
+    return roi[()]
 
 
 def make_progress_bar(pct, width=20):
@@ -871,20 +881,22 @@ def update_performance_tracker():
         return None
 
     # Calculate stats by date and type
-    from collections import defaultdict
     daily_stats = defaultdict(lambda: {'SPREAD': {'W': 0, 'L': 0}, 'PROP': {'W': 0, 'L': 0}})
 
+    # Cumulative totals are tallied in the same pass
+    totals = {'SPREAD': {'W': 0, 'L': 0}, 'PROP': {'W': 0, 'L': 0}}
+
     for r in results:
         bet_type = r.get('bet_type', 'PROP')
         if bet_type not in ['SPREAD', 'PROP']:
             bet_type = 'PROP'
         daily_stats[r['date']][bet_type][r['result']] += 1
+        totals[bet_type][r['result']] += 1
 
-    # Calculate cumulative totals
-    spread_w = sum(d['SPREAD']['W'] for d in daily_stats.values())
-    spread_l = sum(d['SPREAD']['L'] for d in daily_stats.values())
-    prop_w = sum(d['PROP']['W'] for d in daily_stats.values())
-    prop_l = sum(d['PROP']['L'] for d in daily_stats.values())
+    spread_w = totals['SPREAD']['W']
+    spread_l = totals['SPREAD']['L']
+    prop_w = totals['PROP']['W']
+    prop_l = totals['PROP']['L']
     total_w = spread_w + prop_w
     total_l = spread_l + prop_l
 
@@ -892,9 +904,9 @@ def update_performance_tracker():
     prop_pct = (prop_w / (prop_w + prop_l) * 100) if (prop_w + prop_l) > 0 else 0
     total_pct = (total_w / (total_w + total_l) * 100) if (total_w + total_l) > 0 else 0
 
-    spread_roi = calculate_roi(spread_w, spread_l)
-    prop_roi = calculate_roi(prop_w, prop_l)
-    total_roi = calculate_roi(total_w, total_l)
+    spread_roi, prop_roi, total_roi = calculate_roi(
+        [spread_w, prop_w, total_w], [spread_l, prop_l, total_l]
+    )
 
     # Calculate current streak
     sorted_results = sorted(results, key=lambda x: x['date'], reverse=True)
@@ -1022,7 +1034,8 @@ def main():
     print("=" * 60)
     print()
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_db(DB_PATH)
+    ensure_indexes(conn, OUTPUT_INDEXES)
 
     # Fetch betting lines if needed
     if not args.skip_betting:
@@ -1037,9 +1050,10 @@ def main():
 
     print("[2/4] Getting prop picks...")
     prop_picks = get_prop_picks(conn, target_date)
-    plat_count = len([p for p in prop_picks if p.get('prop_tier') == 'PLATINUM'])
-    gold_count = len([p for p in prop_picks if p.get('prop_tier') == 'GOLD'])
-    silver_count = len([p for p in prop_picks if p.get('prop_tier') == 'SILVER'])
+    tier_counts = Counter(p.get('prop_tier') for p in prop_picks)
+    plat_count = tier_counts['PLATINUM']
+    gold_count = tier_counts['GOLD']
+    silver_count = tier_counts['SILVER']
     print(f"      Props: {len(prop_picks)} total (PLATINUM: {plat_count}, GOLD: {gold_count}, SILVER: {silver_count})")
     print()
 
@@ -1057,7 +1071,7 @@ def main():
 
     # Generate social posts
     print("[4/4] Generating social posts...")
-    social_file = generate_social_posts(conn, target_date, prop_picks, spread_picks)
+    social_file = generate_social_posts(conn, target_date, prop_picks, spread_picks, game_times)
     print(f"      Saved: {social_file}")
     print()
 
@@ -16,11 +16,13 @@ Usage:
     python scripts/project_props.py --test  # Test with sample projections
 """
 import argparse
+import json
 import sqlite3
 import sys
 from datetime import date
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 # Add project root to path
@@ -28,6 +30,7 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
+from scripts.db_utils import ensure_indexes, open_db
 
 DB_PATH = config["database"]["path"]
 
@@ -63,9 +66,46 @@ STAT_COLS = {
     "FPT": "(pb.pts + pb.reb * 1.2 + pb.ast * 1.5 + pb.stl * 3 + pb.blk * 3 - pb.tov)",
 }
 
+# Indexes behind the per-player projection lookups
+PROJECTION_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_playerbox_player ON PlayerBox(player_name)",
+    "CREATE INDEX IF NOT EXISTS idx_dvp_team_position_stat ON defense_vs_position(team, position, stat)",
+    "CREATE INDEX IF NOT EXISTS idx_pvt_player_opponent ON player_vs_team(player_name, opponent)",
+    "CREATE INDEX IF NOT EXISTS idx_player_positions_name ON player_positions(player_name)",
+)
+
+# Each player's most recent games (newest first), for a JSON array of players
+_BACKTEST_GAMES_SQL = """
+    SELECT player_name, game_date, opponent, pts, reb, ast, fg3m, pra, pr, pa, ra
+    FROM (
+        SELECT pb.player_name,
+               DATE(g.date_time_utc) as game_date,
+               g.away_team as opponent,
+               pb.pts, pb.reb, pb.ast, pb.fg3m,
+               (pb.pts + pb.reb + pb.ast) as pra,
+               (pb.pts + pb.reb) as pr,
+               (pb.pts + pb.ast) as pa,
+               (pb.reb + pb.ast) as ra,
+               ROW_NUMBER() OVER (
+                   PARTITION BY pb.player_name ORDER BY g.date_time_utc DESC
+               ) as recency
+        FROM PlayerBox pb
+        JOIN Games g ON pb.game_id = g.game_id
+        WHERE pb.player_name IN (SELECT value FROM json_each(?))
+          AND pb.min > 0
+    )
+    WHERE recency <= ?
+    ORDER BY player_name, recency
+"""
+
+# Set once the player_positions fallback warning has been printed
+_positions_warned = False
+
 
 def get_player_position(player_name, conn):
     """Get player's position from roster data or infer from game logs."""
+    global _positions_warned
+
     # Try to find in a players table if exists, otherwise use a simple heuristic
     # For now, we'll need to fetch positions - let's store them
     try:
@@ -74,22 +114,54 @@ def get_player_position(player_name, conn):
         """, conn, params=(player_name,))
         if not df.empty:
             return df.iloc[0]["position"]
-    except:
-        pass
+    except (sqlite3.OperationalError, pd.errors.DatabaseError) as e:
+        # Missing table means every player falls back to SF, which silently
+        # skews DvP adjustments - say so once instead of hiding it
+        if not _positions_warned:
+            print(f"  [WARN] player_positions unavailable ({e}) - defaulting positions to SF")
+            _positions_warned = True
 
     # Default fallback - could be improved
     return "SF"
 
 
-def get_last_n_games_avg(player_name, stat, conn, n=10):
-    """Get player's average over last N games using PlayerBox."""
+def load_player_positions(conn):
+    """
+    Load every player's position at once, for callers that look up many players.
+
+    Returns:
+        dict of player_name -> position; players not in it fall back to SF,
+        same as get_player_position
+    """
+    global _positions_warned
+
+    try:
+        rows = conn.execute("SELECT player_name, position FROM player_positions").fetchall()
+    except sqlite3.OperationalError as e:
+        if not _positions_warned:
+            print(f"  [WARN] player_positions unavailable ({e}) - defaulting positions to SF")
+            _positions_warned = True
+        return {}
+
+    positions = {}
+    for player_name, position in rows:
+        positions.setdefault(player_name, position)
+    return positions
+
+
+def stat_select_expr(stat):
+    """PlayerBox (alias pb) SQL expression for a stat."""
     col = STAT_COLS.get(stat, stat.lower())
 
     # For combo stats, use full expression; for simple stats, prefix with pb.
     if stat in ["PRA", "PR", "PA", "RA", "FPT"]:
-        select_expr = col
-    else:
-        select_expr = f"pb.{col}"
+        return col
+    return f"pb.{col}"
+
+
+def get_last_n_games_avg(player_name, stat, conn, n=10):
+    """Get player's average over last N games using PlayerBox."""
+    select_expr = stat_select_expr(stat)
 
     df = pd.read_sql(f"""
         SELECT {select_expr} as val
@@ -108,13 +180,7 @@ def get_last_n_games_avg(player_name, stat, conn, n=10):
 
 def get_season_avg(player_name, stat, conn):
     """Get player's season average using PlayerBox."""
-    col = STAT_COLS.get(stat, stat.lower())
-
-    # For combo stats, use full expression; for simple stats, prefix with pb.
-    if stat in ["PRA", "PR", "PA", "RA", "FPT"]:
-        select_expr = col
-    else:
-        select_expr = f"pb.{col}"
+    select_expr = stat_select_expr(stat)
 
     df = pd.read_sql(f"""
         SELECT AVG({select_expr}) as val
@@ -128,6 +194,36 @@ def get_season_avg(player_name, stat, conn):
     return df.iloc[0]["val"]
 
 
+def get_recent_and_season_avg(player_name, stat, conn, n=10):
+    """
+    Get a player's last N games average and season average in one query.
+
+    Same values as get_last_n_games_avg and get_season_avg.
+
+    Returns:
+        Tuple of (last N average, season average); None where there is no data
+    """
+    select_expr = stat_select_expr(stat)
+
+    last_n, season = conn.execute(f"""
+        SELECT
+            (SELECT AVG(val) FROM (
+                SELECT {select_expr} as val
+                FROM PlayerBox pb
+                JOIN Games g ON pb.game_id = g.game_id
+                WHERE pb.player_name = ?
+                  AND pb.min > 0
+                ORDER BY g.date_time_utc DESC
+                LIMIT ?
+            )),
+            AVG({select_expr})
+        FROM PlayerBox pb
+        WHERE pb.player_name = ?
+          AND pb.min > 0
+    """, (player_name, n, player_name)).fetchone()
+    return last_n, season
+
+
 def get_vs_opponent_avg(player_name, opponent, stat, conn):
     """Get player's average vs specific opponent."""
     # Map stat to column(s) in player_vs_team
@@ -140,40 +236,40 @@ def get_vs_opponent_avg(player_name, opponent, stat, conn):
 
     # Handle combo stats
     if stat in ["PRA", "PR", "PA", "RA"]:
-        df = pd.read_sql("""
+        row = conn.execute("""
             SELECT avg_pts, avg_reb, avg_ast, games
             FROM player_vs_team
             WHERE player_name = ? AND opponent = ?
-        """, conn, params=(player_name, opponent))
+        """, (player_name, opponent)).fetchone()
 
-        if df.empty:
+        if row is None:
             return None, 0
 
-        row = df.iloc[0]
+        avg_pts, avg_reb, avg_ast, games = row
         if stat == "PRA":
-            val = row["avg_pts"] + row["avg_reb"] + row["avg_ast"]
+            val = avg_pts + avg_reb + avg_ast
         elif stat == "PR":
-            val = row["avg_pts"] + row["avg_reb"]
+            val = avg_pts + avg_reb
         elif stat == "PA":
-            val = row["avg_pts"] + row["avg_ast"]
+            val = avg_pts + avg_ast
         elif stat == "RA":
-            val = row["avg_reb"] + row["avg_ast"]
-        return val, row["games"]
+            val = avg_reb + avg_ast
+        return val, games
 
     # Individual stat
     col = stat_map.get(stat)
     if col is None:
         return None, 0
 
-    df = pd.read_sql(f"""
+    row = conn.execute(f"""
         SELECT {col} as val, games
         FROM player_vs_team
         WHERE player_name = ? AND opponent = ?
-    """, conn, params=(player_name, opponent))
+    """, (player_name, opponent)).fetchone()
 
-    if df.empty:
+    if row is None:
         return None, 0
-    return df.iloc[0]["val"], df.iloc[0]["games"]
+    return row
 
 
 def get_dvp_adjustment(opponent, position, stat, conn):
@@ -200,15 +296,48 @@ def get_dvp_adjustment(opponent, position, stat, conn):
         ast_adj = get_dvp_adjustment(opponent, position, "AST", conn)
         return reb_adj + ast_adj
 
-    df = pd.read_sql("""
+    row = conn.execute("""
         SELECT diff_from_avg
         FROM defense_vs_position
         WHERE team = ? AND position = ? AND stat = ?
-    """, conn, params=(opponent, position, stat))
+    """, (opponent, position, stat)).fetchone()
 
-    if df.empty:
+    if row is None:
         return 0.0
-    return df.iloc[0]["diff_from_avg"]
+    return row[0]
+
+
+# Component stats summed for combo-stat DvP adjustments
+DVP_COMBO_STATS = {
+    "PRA": ("PTS", "REB", "AST"),
+    "PR": ("PTS", "REB"),
+    "PA": ("PTS", "AST"),
+    "RA": ("REB", "AST"),
+}
+
+
+def load_dvp_adjustments(conn):
+    """
+    Load the defense_vs_position table once for repeated DvP lookups.
+
+    Returns:
+        dict of (team, position, stat) -> diff_from_avg
+    """
+    dvp = {}
+    for team, position, stat, diff in conn.execute("""
+        SELECT team, position, stat, diff_from_avg
+        FROM defense_vs_position
+    """):
+        dvp.setdefault((team, position, stat), diff)
+    return dvp
+
+
+def lookup_dvp_adjustment(dvp, opponent, position, stat):
+    """Same as get_dvp_adjustment, reading from a load_dvp_adjustments() table."""
+    if stat in DVP_COMBO_STATS:
+        return sum(lookup_dvp_adjustment(dvp, opponent, position, component)
+                   for component in DVP_COMBO_STATS[stat])
+    return dvp.get((opponent, position, stat), 0.0)
 
 
 def project_player_prop(player_name, opponent, stat, conn, position=None):
@@ -229,8 +358,7 @@ def project_player_prop(player_name, opponent, stat, conn, position=None):
         position = get_player_position(player_name, conn)
 
     # Get components
-    last_10 = get_last_n_games_avg(player_name, stat, conn, n=10)
-    season = get_season_avg(player_name, stat, conn)
+    last_10, season = get_recent_and_season_avg(player_name, stat, conn, n=10)
     vs_opp, vs_opp_games = get_vs_opponent_avg(player_name, opponent, stat, conn)
     dvp_adj = get_dvp_adjustment(opponent, position, stat, conn)
 
@@ -349,6 +477,30 @@ def build_player_positions_table(conn):
             print(f"  Saved {len(combined)} player positions")
 
 
+def prior_game_averages(values, n, window=10):
+    """
+    Averages over the games before each of a player's n most recent games.
+
+    values holds one stat per game, newest first, so the games before game i
+    are values[i+1:]. Uses suffix sums so every game is O(1), and skips NaNs
+    the same way pandas mean() does.
+
+    Returns:
+        Tuple of (last `window` games average, all prior games average) arrays of length n
+    """
+    valid = ~np.isnan(values)
+    # suffix_*[k] = total over values[k:] (with a trailing 0 for the empty suffix)
+    suffix_sum = np.append(np.cumsum(np.where(valid, values, 0)[::-1])[::-1], 0)
+    suffix_count = np.append(np.cumsum(valid[::-1])[::-1], 0)
+
+    start = np.arange(1, n + 1)
+    end = np.minimum(start + window, len(values))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        last_n = (suffix_sum[start] - suffix_sum[end]) / (suffix_count[start] - suffix_count[end])
+        season = suffix_sum[start] / suffix_count[start]
+    return last_n, season
+
+
 def backtest_projections(conn, num_players=50, num_games=10):
     """
     Backtest projections against actual results using PlayerBox.
@@ -364,6 +516,8 @@ def backtest_projections(conn, num_players=50, num_games=10):
 
     # Get top usage players
     top_players = get_top_usage_players(conn, limit=num_players)
+    dvp = load_dvp_adjustments(conn)
+    positions = load_player_positions(conn)
 
     # Column mapping for backtest (simple stat names for dataframe)
     BACKTEST_COLS = {
@@ -371,102 +525,93 @@ def backtest_projections(conn, num_players=50, num_games=10):
         "PRA": "pra", "PR": "pr", "PA": "pa", "RA": "ra"
     }
 
-    results = []
+    # Projection inputs per (game, stat), one frame per player; the projection
+    # and error math then runs over all samples at once
+    frames = []
+
+    # Every player's recent games from PlayerBox in one query (extra games for history)
+    all_games = pd.read_sql(
+        _BACKTEST_GAMES_SQL, conn,
+        params=(json.dumps(top_players["player_name"].tolist()), num_games + 10),
+    )
+    games_by_player = dict(tuple(all_games.groupby("player_name", sort=False)))
 
-    for _, player_row in top_players.iterrows():
-        player_name = player_row["player_name"]
-
-        # Get player's recent games from PlayerBox
-        games = pd.read_sql("""
-            SELECT DATE(g.date_time_utc) as game_date,
-                   g.away_team as opponent,
-                   pb.pts, pb.reb, pb.ast, pb.fg3m,
-                   (pb.pts + pb.reb + pb.ast) as pra,
-                   (pb.pts + pb.reb) as pr,
-                   (pb.pts + pb.ast) as pa,
-                   (pb.reb + pb.ast) as ra
-            FROM PlayerBox pb
-            JOIN Games g ON pb.game_id = g.game_id
-            WHERE pb.player_name = ?
-              AND pb.min > 0
-            ORDER BY g.date_time_utc DESC
-            LIMIT ?
-        """, conn, params=(player_name, num_games + 10))  # Get extra for history
-
-        if len(games) < num_games + 5:
+    for player_name in top_players["player_name"]:
+        games = games_by_player.get(player_name)
+        if games is None or len(games) < num_games + 5:
             continue  # Need enough history
 
         # Get position
-        pos = get_player_position(player_name, conn)
-
-        # For each of the last N games, project using prior data
-        for i in range(num_games):
-            if i >= len(games) - 10:
-                break
-
-            game = games.iloc[i]
-            game_date = game["game_date"]
-            opponent = game["opponent"]
-
-            # Get stats BEFORE this game for projection
-            prior_games = games.iloc[i+1:i+11]  # 10 games before this one
+        pos = positions.get(player_name, "SF")
 
-            if len(prior_games) < 5:
-                continue
-
-            for stat in STATS:
-                col = BACKTEST_COLS[stat]
-                actual = game[col]
-
-                # Calculate projection components from prior data
-                last_10_avg = prior_games[col].mean()
-                season_avg = games.iloc[i+1:][col].mean()  # All prior games
-
-                # DVP adjustment (static for simplicity)
-                dvp_adj = get_dvp_adjustment(opponent, pos, stat, conn)
-
-                # Calculate projection (simplified - no vs_opp for speed)
-                projection = (
-                    last_10_avg * 0.50 +
-                    season_avg * 0.40 +
-                    (season_avg + dvp_adj) * 0.10
-                )
+        # Project each of the last N games (newest first) using only the games
+        # after it in the list, i.e. before it in time; each needs 10 prior games
+        n_test = min(num_games, len(games) - 10)
+        if n_test <= 0:
+            continue
 
-                # Calculate error
-                if actual > 0:
-                    error_pct = abs(projection - actual) / actual * 100
-                else:
-                    error_pct = 0 if projection < 1 else 100
-
-                results.append({
-                    "player": player_name,
-                    "stat": stat,
-                    "projection": round(projection, 1),
-                    "actual": actual,
-                    "error_pct": round(error_pct, 1),
-                    "within_15": error_pct <= 15
-                })
-
-    if not results:
+        cols = [BACKTEST_COLS[stat] for stat in STATS]
+        averages = [prior_game_averages(games[col].to_numpy(dtype=float), n_test) for col in cols]
+        opponents = games["opponent"].to_numpy()[:n_test]
+
+        # Rows are game-major, stat-minor: (game 0, PTS), (game 0, REB), ...
+        frames.append(pd.DataFrame({
+            "player": player_name,
+            "stat": np.tile(STATS, n_test),
+            "last_10_avg": np.column_stack([last_10 for last_10, _ in averages]).ravel(),
+            "season_avg": np.column_stack([season for _, season in averages]).ravel(),
+            "dvp_adj": [lookup_dvp_adjustment(dvp, opponent, pos, stat)  # DVP (static for simplicity)
+                        for opponent in opponents for stat in STATS],
+            "actual": games[cols].to_numpy()[:n_test].ravel(),
+        }))
+
+    if not frames:
         print("No backtest results generated")
         return
 
-    df = pd.DataFrame(results)
+    samples = pd.concat(frames, ignore_index=True)
+    last_10_avg = samples["last_10_avg"]
+    season_avg = samples["season_avg"]
+    actual = samples["actual"]
+
+    # Calculate projection (simplified - no vs_opp for speed)
+    projection = (
+        last_10_avg * 0.50 +
+        season_avg * 0.40 +
+        (season_avg + samples["dvp_adj"]) * 0.10
+    )
+
+    # Calculate error (0/100% when the actual is 0, depending on whether we projected ~0)
+    error_pct = ((projection - actual).abs() / actual * 100).where(
+        actual > 0, np.where(projection < 1, 0, 100)
+    )
+
+    df = pd.DataFrame({
+        # Low-cardinality labels as categoricals: smaller, and groupby runs on codes
+        "player": samples["player"].astype("category"),
+        "stat": pd.Categorical(samples["stat"], categories=STATS),
+        "projection": projection.round(1),
+        "actual": actual,
+        "error_pct": error_pct.round(1),
+        "within_15": error_pct <= 15,
+    })
 
     # Summary stats
     print("=== BACKTEST RESULTS ===\n")
 
-    for stat in STATS:
-        stat_df = df[df["stat"] == stat]
-        if stat_df.empty:
-            continue
+    # Categories are in STATS order, so groups come out in display order
+    by_stat = df.groupby("stat", observed=True).agg(
+        samples=("error_pct", "size"),
+        within_15=("within_15", "mean"),
+        avg_error=("error_pct", "mean"),
+        median_error=("error_pct", "median"),
+    )
 
-        within_15 = stat_df["within_15"].mean() * 100
-        avg_error = stat_df["error_pct"].mean()
-        median_error = stat_df["error_pct"].median()
+    for stat, samples, within_15, avg_error, median_error in by_stat.itertuples():
+        within_15 *= 100
 
         print(f"{stat}:")
-        print(f"  Samples: {len(stat_df)}")
+        print(f"  Samples: {samples}")
         print(f"  Within 15%: {within_15:.1f}%")
         print(f"  Avg Error: {avg_error:.1f}%")
         print(f"  Median Error: {median_error:.1f}%")
@@ -528,7 +673,8 @@ def main():
 
     args = parser.parse_args()
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_db(DB_PATH)
+    ensure_indexes(conn, PROJECTION_INDEXES)
 
     if args.backtest:
         backtest_projections(conn, num_players=args.top, num_games=10)
@@ -13,6 +13,7 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
+from scripts.db_utils import utc_date_range
 
 DB_PATH = config["database"]["path"]
 
@@ -30,8 +31,8 @@ def get_todays_games(conn, target_date=None):
     games = conn.execute("""
         SELECT game_id, home_team, away_team
         FROM Games
-        WHERE DATE(date_time_utc) = ?
-    """, (target_date,)).fetchall()
+        WHERE date_time_utc >= ? AND date_time_utc < ?
+    """, utc_date_range(target_date)).fetchall()
 
     return [
         {"game_id": g[0], "home_team": g[1], "away_team": g[2]}
@@ -268,6 +268,7 @@ def fetch_team_advanced_stats(conn, season="2024-25"):
         abbrev_map = get_team_abbrev_map()
         df['TEAM_ABBREV'] = df['TEAM_ID'].map(abbrev_map)
 
+        updated_at = datetime.now().isoformat()
         count = 0
         for _, row in df.iterrows():
             conn.execute("""
@@ -294,7 +295,7 @@ def fetch_team_advanced_stats(conn, season="2024-25"):
                 row.get('REB_PCT'),
                 row.get('TS_PCT'),
                 row.get('EFG_PCT'),
-                datetime.now().isoformat()
+                updated_at
             ))
             count += 1
 
@@ -326,6 +327,7 @@ def fetch_player_advanced_stats(conn, season="2024-25", top_n=150):
         df = stats.get_data_frames()[0]
         df = df.sort_values('MIN', ascending=False).head(top_n)
 
+        updated_at = datetime.now().isoformat()
         count = 0
         for _, row in df.iterrows():
             conn.execute("""
@@ -354,7 +356,7 @@ def fetch_player_advanced_stats(conn, season="2024-25", top_n=150):
                 row.get('DEF_RATING') or row.get('E_DEF_RATING'),
                 row.get('NET_RATING') or row.get('E_NET_RATING'),
                 row.get('PIE'),
-                datetime.now().isoformat()
+                updated_at
             ))
             count += 1
 
@@ -389,6 +391,7 @@ def fetch_team_clutch_stats(conn, season="2024-25"):
         abbrev_map = get_team_abbrev_map()
         df['TEAM_ABBREV'] = df['TEAM_ID'].map(abbrev_map)
 
+        updated_at = datetime.now().isoformat()
         count = 0
         for _, row in df.iterrows():
             conn.execute("""
@@ -419,7 +422,7 @@ def fetch_team_clutch_stats(conn, season="2024-25"):
                 row.get('FTA'),
                 row.get('FT_PCT'),
                 row.get('PLUS_MINUS'),
-                datetime.now().isoformat()
+                updated_at
             ))
             count += 1
 
@@ -453,6 +456,7 @@ def fetch_player_clutch_stats(conn, season="2024-25", top_n=100):
         df = stats.get_data_frames()[0]
         df = df.sort_values('MIN', ascending=False).head(top_n)
 
+        updated_at = datetime.now().isoformat()
         count = 0
         for _, row in df.iterrows():
             conn.execute("""
@@ -480,7 +484,7 @@ def fetch_player_clutch_stats(conn, season="2024-25", top_n=100):
                 row.get('FTA'),
                 row.get('FT_PCT'),
                 row.get('PLUS_MINUS'),
-                datetime.now().isoformat()
+                updated_at
             ))
             count += 1
 
@@ -564,6 +568,7 @@ def calculate_ats_stats(conn, season="2025-26"):
         SELECT DISTINCT away_team FROM GameATSResults
     """).fetchall()
 
+    updated_at = datetime.now().isoformat()
     for (team,) in all_teams:
         home_stats = conn.execute("""
             SELECT COUNT(*), SUM(home_covered), SUM(away_covered), SUM(push),
@@ -614,7 +619,7 @@ def calculate_ats_stats(conn, season="2025-26"):
             fav_stats[0] or 0, fav_stats[1] or 0,
             dog_stats[0] or 0, dog_stats[1] or 0,
             home_stats[4], home_stats[5], home_stats[6],
-            datetime.now().isoformat()
+            updated_at
         ))
 
     conn.commit()
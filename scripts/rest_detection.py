@@ -4,8 +4,10 @@ Rest and Back-to-Back Detection
 Analyzes team rest patterns and flags potential fatigue situations.
 """
 import sqlite3
+from bisect import bisect_left
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Tuple
 
 
 def get_team_rest_info(team: str, game_date: str, conn: sqlite3.Connection) -> Dict:
@@ -75,6 +77,73 @@ def get_team_rest_info(team: str, game_date: str, conn: sqlite3.Connection) -> D
     }
 
 
+def get_team_rest_info_batch(
+    lookups: Iterable[Tuple[str, str]],
+    conn: sqlite3.Connection
+) -> Dict[Tuple[str, str], Dict]:
+    """
+    Get rest information for many (team, game_date) pairs with one query.
+
+    Gives the same dict per pair as get_team_rest_info, for callers (e.g.
+    backtests) that need rest info for every game in a date range.
+
+    Args:
+        lookups: (team abbreviation, YYYY-MM-DD game date) pairs
+        conn: Database connection
+
+    Returns:
+        Dict mapping each (team, game_date) pair to its rest info
+    """
+    lookups = set(lookups)
+    if not lookups:
+        return {}
+
+    latest_date = max(game_date for _, game_date in lookups)
+    rows = conn.execute("""
+        SELECT home_team, away_team, DATE(date_time_utc)
+        FROM Games
+        WHERE date_time_utc IS NOT NULL
+          AND date_time_utc < ?
+    """, (latest_date,)).fetchall()
+
+    team_dates = defaultdict(list)
+    for home_team, away_team, day in rows:
+        team_dates[home_team].append(day)
+        team_dates[away_team].append(day)
+    for dates in team_dates.values():
+        dates.sort()
+
+    rest_info = {}
+    for team, game_date in lookups:
+        dates = team_dates.get(team, [])
+        end = bisect_left(dates, game_date)
+
+        if end == 0:
+            rest_info[(team, game_date)] = {
+                'last_game_date': None,
+                'days_rest': 999,  # No recent game found
+                'is_b2b': False,
+                'games_in_last_3_days': 0
+            }
+            continue
+
+        last_game_dt_str = dates[end - 1]
+        last_game_dt = datetime.strptime(last_game_dt_str, '%Y-%m-%d')
+        game_dt = datetime.strptime(game_date, '%Y-%m-%d')
+        days_rest = (game_dt - last_game_dt).days
+
+        three_days_ago = (game_dt - timedelta(days=3)).strftime('%Y-%m-%d')
+
+        rest_info[(team, game_date)] = {
+            'last_game_date': last_game_dt_str,
+            'days_rest': days_rest,
+            'is_b2b': days_rest == 1,
+            'games_in_last_3_days': end - bisect_left(dates, three_days_ago)
+        }
+
+    return rest_info
+
+
 def calculate_rest_adjustment(
     home_rest: Dict,
     away_rest: Dict
@@ -4,9 +4,14 @@ Shared utility functions for AXIOM scripts.
 Consolidates common functions used across daily_predictions.py, backtest.py,
 and other analytics scripts to avoid duplication.
 """
+import re
+
 import numpy as np
 import pandas as pd
 
+# Prop pick string pattern: 'Tyler Kolek OVER 2.4 RA'
+_PROP_RE = re.compile(r'^(.+?)\s+(OVER|UNDER)\s+(\d+\.?\d*)\s+(\w+)$')
+
 
 def get_team_recent_games(team, before_date, conn, limit=10):
     """
@@ -52,13 +57,13 @@ def calculate_team_stats(games, team):
     opp_scores = []
     wins = 0
 
-    for _, game in games.iterrows():
-        if game['home'] == team:
-            score = game['home_score']
-            opp_score = game['away_score']
+    for game in games.itertuples(index=False):
+        if game.home == team:
+            score = game.home_score
+            opp_score = game.away_score
         else:
-            score = game['away_score']
-            opp_score = game['home_score']
+            score = game.away_score
+            opp_score = game.home_score
 
         scores.append(score)
         opp_scores.append(opp_score)
@@ -73,3 +78,15 @@ def calculate_team_stats(games, team):
         'games_count': len(games),
         'record': f"{wins}-{len(games) - wins}"
     }
+
+
+def parse_prop_pick(pick_str):
+    """
+    Parse a prop pick string.
+    'Tyler Kolek OVER 2.4 RA' -> (player_name, direction, line, stat)
+    'Matas Buzelis OVER 13.1 PRA' -> (player_name, direction, line, stat)
+    """
+    match = _PROP_RE.match(pick_str)
+    if match:
+        return match.group(1), match.group(2), float(match.group(3)), match.group(4)
+    return None, None, None, None
@@ -316,8 +316,8 @@ def check_data_freshness(conn, target_date: str) -> dict:
             days_old = (target - max_date).days
             if days_old > 30:
                 warnings.append(f"player_game_logs is STALE ({days_old} days old) - using PlayerBox instead")
-    except:
-        pass
+    except (sqlite3.OperationalError, pd.errors.DatabaseError) as e:
+        warnings.append(f"player_game_logs unavailable: {e}")
 
     return {"issues": issues, "warnings": warnings}
 
@@ -0,0 +1,202 @@
+"""
+Tests for ai_verify_picks module.
+
+Run with: python -m pytest tests/test_ai_verify_picks.py -v
+"""
+import asyncio
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import scripts.ai_verify_picks as ai_verify_picks
+from scripts.ai_verify_picks import (
+    RateLimiter,
+    _rule_based_verdict,
+    get_additional_context,
+    get_picks_to_verify,
+    get_verified_picks,
+    init_verification_tables,
+    verify_pick_with_ai,
+    verify_picks,
+)
+
+TARGET_DATE = "2026-01-29"
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""
+        CREATE TABLE props_edges (
+            date TEXT, player_name TEXT, opponent TEXT, prop_type TEXT,
+            line REAL, projection REAL, edge REAL, edge_pct REAL, pick TEXT,
+            confidence TEXT, stat_tier TEXT, factors TEXT, confidence_score REAL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE player_game_logs (
+            player_name TEXT, game_date TEXT, opponent TEXT, home_away TEXT,
+            days_rest INTEGER, is_b2b INTEGER, points REAL, rebounds REAL
+        )
+    """)
+    factors = json.dumps({"last_10_avg": 25.0, "season_avg": 24.0, "vs_opp_games": 3})
+    conn.executemany(
+        "INSERT INTO props_edges VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)",
+        [
+            (TARGET_DATE, "Player A", "BOS", "PTS", 22.5, 26.0, 3.5, 15.6, "OVER",
+             "HIGH", "S_TIER", factors, 80),
+            (TARGET_DATE, "Player B", "LAL", "REB", 8.5, 6.0, -2.5, -29.4, "UNDER",
+             "MEDIUM", "A_TIER", factors, 60),
+            (TARGET_DATE, "Player C", "MIA", "PTS", 10.5, 11.0, 0.5, 4.8, "OVER",
+             "LOW", "B_TIER", factors, 20),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO player_game_logs VALUES (?,?,?,?,?,?,?,?)",
+        [("Player A", f"2026-01-{d:02d}", "NYK", "HOME", 1, d % 2, 20 + d, 5)
+         for d in range(10, 20)],
+    )
+    conn.commit()
+    init_verification_tables(conn)
+    yield conn
+    conn.close()
+
+
+class FakeMessages:
+    """Stand-in for the async messages API that records peak concurrency."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.last_request = kwargs
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        text = "VERDICT: REJECT\nCONFIDENCE: HIGH\nREASON: test"
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+class FakeAsyncAnthropic:
+    """Stand-in for anthropic.AsyncAnthropic."""
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    messages = FakeMessages()
+    monkeypatch.setattr(ai_verify_picks, "HAS_ANTHROPIC", True)
+    monkeypatch.setattr(ai_verify_picks, "anthropic", SimpleNamespace(
+        AsyncAnthropic=lambda api_key: FakeAsyncAnthropic(messages)), raising=False)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    return messages
+
+
+class TestVerifyPicks:
+    """Test suite for pick verification."""
+
+    def test_dry_run_verifies_high_and_medium_only(self, conn):
+        results = verify_picks(conn, TARGET_DATE, dry_run=True, verbose=False)
+        assert [r["player_name"] for r in results] == ["Player A", "Player B"]
+        assert all(r["verdict"] == "CONFIRM" for r in results)
+
+    def test_concurrency_is_bounded(self):
+        messages = FakeMessages()
+        client = SimpleNamespace(messages=messages)
+
+        async def run():
+            semaphore = asyncio.Semaphore(3)
+            limiter = RateLimiter(rpm=100)
+            return await asyncio.gather(*(
+                verify_pick_with_ai("prompt", client, semaphore, limiter)
+                for _ in range(10)
+            ))
+
+        results = asyncio.run(run())
+        assert len(results) == 10
+        assert all(r["verdict"] == "REJECT" for r in results)
+        assert messages.peak == 3
+        assert messages.last_request["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_rate_limiter_window(self):
+        async def run():
+            limiter = RateLimiter(rpm=2, window=0.05)
+            start = asyncio.get_running_loop().time()
+            for _ in range(3):
+                await limiter.wait()
+            return asyncio.get_running_loop().time() - start
+
+        assert asyncio.run(run()) >= 0.04
+
+    def test_cached_verdicts_skip_api(self, conn, fake_api):
+        first = verify_picks(conn, TARGET_DATE, verbose=False)
+        assert fake_api.calls == 2
+
+        second = verify_picks(conn, TARGET_DATE, verbose=False)
+        assert fake_api.calls == 2
+        assert [r["verdict"] for r in second] == [r["verdict"] for r in first]
+
+        verify_picks(conn, TARGET_DATE, verbose=False, use_cache=False)
+        assert fake_api.calls == 4
+
+    def test_results_saved_and_replaced(self, conn, fake_api):
+        verify_picks(conn, TARGET_DATE, verbose=False)
+        verify_picks(conn, TARGET_DATE, verbose=False)
+        verdicts = conn.execute("SELECT verdict FROM picks_verification").fetchall()
+        assert [v[0] for v in verdicts] == ["REJECT", "REJECT"]
+        assert get_verified_picks(conn, TARGET_DATE, include_flagged=True) == []
+
+    def test_verified_picks_filter_by_verdict(self, conn):
+        conn.executemany("INSERT INTO picks_verification VALUES (?,?,?,?,?,?)", [
+            (TARGET_DATE, "Player A", "PTS", "FLAG", "LOW", "thin sample"),
+            (TARGET_DATE, "Player B", "REB", "CONFIRM", "HIGH", "aligned"),
+            (TARGET_DATE, "Player C", "PTS", "REJECT", "HIGH", "no edge"),
+        ])
+        confirmed = get_verified_picks(conn, TARGET_DATE)
+        assert [p["player_name"] for p in confirmed] == ["Player B"]
+        with_flagged = get_verified_picks(conn, TARGET_DATE, include_flagged=True)
+        assert [p["player_name"] for p in with_flagged] == ["Player B", "Player A"]
+
+    def test_additional_context_last_five(self, conn):
+        picks = get_picks_to_verify(conn, TARGET_DATE)
+        contexts = get_additional_context(picks, conn)
+        context = contexts[("Player A", "PTS")]
+        assert context["last_5_values"] == [39, 38, 37, 36, 35]
+        assert context["last_5_avg"] == 37.0
+        assert context["recent_b2b_rate"] == 0.6
+        assert ("Player B", "REB") not in contexts
+
+
+class TestRuleBasedVerdict:
+    """Test suite for deterministic verdicts."""
+
+    PICK = {"pick": "OVER", "line": 20.5, "edge_pct": 30.0, "projection": 26.7}
+
+    def test_confirms_large_aligned_edge(self):
+        factors = {"last_10_avg": 24.0, "season_avg": 23.1, "vs_opp_avg": 25.5, "vs_opp_games": 4}
+        assert _rule_based_verdict(self.PICK, factors, {})["verdict"] == "CONFIRM"
+
+    def test_defers_when_an_average_disagrees(self):
+        factors = {"last_10_avg": 24.0, "season_avg": 19.8, "vs_opp_avg": 25.5, "vs_opp_games": 4}
+        assert _rule_based_verdict(self.PICK, factors, {}) is None
+
+    def test_flags_thin_sample_outlier_projection(self):
+        pick = {**self.PICK, "edge_pct": 18.0}
+        factors = {"last_10_avg": 15.0, "season_avg": 16.0, "vs_opp_avg": "N/A", "vs_opp_games": 1}
+        assert _rule_based_verdict(pick, factors, {})["verdict"] == "FLAG"
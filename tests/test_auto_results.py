@@ -0,0 +1,146 @@
+"""
+Tests for auto_results module.
+
+Run with: python -m pytest tests/test_auto_results.py -v
+"""
+import copy
+import csv
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import scripts.auto_results as auto_results
+from scripts.auto_results import CANONICAL_FIELDS, fetch_espn_scoreboard, run_auto_results
+
+SCOREBOARD = {
+    "events": [{
+        "competitions": [{
+            "status": {"type": {"completed": True}},
+            "competitors": [
+                {"homeAway": "home", "team": {"abbreviation": "GS"}, "score": "112"},
+                {"homeAway": "away", "team": {"abbreviation": "BOS"}, "score": "104"},
+            ],
+        }],
+    }],
+}
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """Stand-in for requests.Session that counts GETs."""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        return FakeResponse(self.payload)
+
+
+@pytest.fixture
+def espn(tmp_path, monkeypatch):
+    session = FakeSession(copy.deepcopy(SCOREBOARD))
+    monkeypatch.setattr(auto_results, "ESPN_CACHE_DIR", tmp_path / "espn_cache")
+    monkeypatch.setattr(auto_results, "_SESSION", session)
+    return session
+
+
+class TestFetchEspnScoreboard:
+    """Test suite for ESPN scoreboard fetching."""
+
+    def test_parses_and_normalizes_teams(self, espn):
+        games = fetch_espn_scoreboard("2026-01-29")
+        assert games == [{
+            "home_team": "GSW", "away_team": "BOS",
+            "home_score": 112, "away_score": 104, "is_final": True,
+        }]
+
+    def test_final_scoreboard_is_cached(self, espn):
+        fetch_espn_scoreboard("2026-01-29")
+        fetch_espn_scoreboard("2026-01-29")
+        assert espn.calls == 1
+
+    def test_live_scoreboard_expires(self, espn, monkeypatch):
+        espn.payload["events"][0]["competitions"][0]["status"]["type"]["completed"] = False
+        monkeypatch.setattr(auto_results, "ESPN_CACHE_LIVE_SECONDS", 0)
+        fetch_espn_scoreboard("2026-01-29")
+        fetch_espn_scoreboard("2026-01-29")
+        assert espn.calls == 2
+
+
+@pytest.fixture
+def results_env(tmp_path, monkeypatch, espn):
+    db_path = tmp_path / "test.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE Games (game_id TEXT, date_time_utc TEXT)")
+    conn.execute("""
+        CREATE TABLE PlayerBox (
+            game_id TEXT, player_name TEXT, pts INTEGER, reb INTEGER,
+            ast INTEGER, fg3m INTEGER
+        )
+    """)
+    conn.execute("INSERT INTO Games VALUES ('0022500700', '2026-01-29T00:30:00Z')")
+    conn.executemany("INSERT INTO PlayerBox VALUES (?,?,?,?,?,?)", [
+        ("0022500700", "Stephen Curry", 31, 4, 6, 5),
+        ("0022500700", "Jayson Tatum", 22, 9, None, 2),
+    ])
+    conn.commit()
+    conn.close()
+
+    results_csv = tmp_path / "results.csv"
+    picks = [
+        {"date": "2026-01-29", "game": "BOS @ GSW", "bet_type": "SPREAD",
+         "pick": "GSW -5.5", "line": "5.5"},
+        {"date": "2026-01-29", "game": "vs BOS", "bet_type": "PROP",
+         "pick": "Stephen Curry OVER 38.5 PRA"},
+        {"date": "2026-01-29", "game": "vs GSW", "bet_type": "PROP",
+         "pick": "Jayson Tatum UNDER 30.5 PA"},
+    ]
+    with open(results_csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CANONICAL_FIELDS)
+        writer.writeheader()
+        writer.writerows(picks)
+
+    monkeypatch.setattr(auto_results, "DB_PATH", str(db_path))
+    monkeypatch.setattr(auto_results, "RESULTS_CSV", results_csv)
+    return results_csv
+
+
+class TestRunAutoResults:
+    """Test suite for resolving pending picks."""
+
+    def test_dry_run_resolves_without_writing(self, results_env, capsys):
+        before = results_env.read_text(encoding="utf-8")
+        updated = run_auto_results(dry_run=True)
+        out = capsys.readouterr().out
+        assert updated == 2
+        assert "GSW -5.5 -> W (actual: 8)" in out
+        assert "Stephen Curry OVER 38.5 PRA -> W (actual: 41)" in out
+        assert "[SKIP] Jayson Tatum UNDER 30.5 PA" in out
+        assert results_env.read_text(encoding="utf-8") == before
+
+    def test_writes_results_atomically(self, results_env, monkeypatch):
+        monkeypatch.setitem(sys.modules, "scripts.generate_daily_output", None)
+        monkeypatch.delenv("DISCORD_WEBHOOK_RESULTS", raising=False)
+        assert run_auto_results() == 2
+
+        with open(results_env, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [(r["result"], r["actual"]) for r in rows] == [("W", "8"), ("W", "41"), ("", "")]
+        assert not results_env.with_suffix(".csv.tmp").exists()
@@ -0,0 +1,177 @@
+"""
+Tests for backtest_daily_pipeline module.
+
+Run with: python -m pytest tests/test_backtest_daily_pipeline.py -v
+"""
+import random
+import sqlite3
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.backtest_daily_pipeline import (
+    generate_report,
+    get_team_stats,
+    load_team_game_logs,
+    run_backtest,
+    run_backtest_parallel,
+)
+from scripts.rest_detection import get_team_rest_info, get_team_rest_info_batch
+from scripts.shared_utils import calculate_team_stats, get_team_recent_games
+
+TEAMS = ["BOS", "LAL", "MIA", "NYK", "GSW", "DEN"]
+START = date(2025, 10, 22)
+
+
+def build_season_db(days=40, seed=7):
+    """In-memory database with a small synthetic schedule, box scores and lines."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE Teams (team_id INTEGER PRIMARY KEY, abbreviation TEXT);
+        CREATE TABLE Games (
+            game_id TEXT PRIMARY KEY, date_time_utc TEXT, home_team TEXT,
+            away_team TEXT, season TEXT
+        );
+        CREATE TABLE Betting (
+            game_id TEXT PRIMARY KEY, espn_current_spread REAL,
+            espn_closing_spread REAL, covers_closing_spread REAL
+        );
+        CREATE TABLE GameStates (
+            game_id TEXT, game_date TEXT, home TEXT, away TEXT,
+            home_score INTEGER, away_score INTEGER, is_final_state INTEGER
+        );
+        CREATE TABLE TeamBox (game_id TEXT, team_id INTEGER, pts INTEGER);
+    """)
+    team_ids = {team: 1610612700 + i for i, team in enumerate(TEAMS)}
+    conn.executemany("INSERT INTO Teams VALUES (?, ?)", [(v, k) for k, v in team_ids.items()])
+
+    game_num = 0
+    for day in range(days):
+        game_date = (START + timedelta(days=day)).isoformat()
+        teams = TEAMS[:]
+        rng.shuffle(teams)
+        # Not every team plays every night, so rest and B2B both occur
+        n_games = rng.choice([1, 2])
+        for home, away in zip(teams[0:2 * n_games:2], teams[1:2 * n_games:2]):
+            game_num += 1
+            game_id = f"00225{game_num:05d}"
+            home_pts = rng.randint(95, 130)
+            away_pts = rng.randint(95, 130)
+            conn.execute("INSERT INTO Games VALUES (?, ?, ?, ?, '2025-2026')",
+                         (game_id, f"{game_date}T23:30:00Z", home, away))
+            spread = round(rng.uniform(-9, 9) * 2) / 2
+            if game_num % 7 == 0:
+                conn.execute("INSERT INTO Betting VALUES (?, NULL, NULL, NULL)", (game_id,))
+            else:
+                conn.execute("INSERT INTO Betting VALUES (?, ?, NULL, ?)", (game_id, spread, spread))
+            conn.execute("INSERT INTO GameStates VALUES (?, ?, ?, ?, ?, ?, 1)",
+                         (game_id, game_date, home, away, home_pts, away_pts))
+            conn.executemany("INSERT INTO TeamBox VALUES (?, ?, ?)", [
+                (game_id, team_ids[home], home_pts), (game_id, team_ids[away], away_pts)
+            ])
+    conn.commit()
+    return conn
+
+
+@pytest.fixture
+def conn():
+    conn = build_season_db()
+    yield conn
+    conn.close()
+
+
+class TestRunBacktest:
+    """Test suite for the daily pipeline backtest."""
+
+    def test_bets_are_scored_consistently(self, conn):
+        df = run_backtest("2025-10-22", "2025-11-30", conn)
+        assert len(df) > 20
+
+        home_fav = df["pick"].str.split(" ").str[0] == df["game"].str.split(" @ ").str[1]
+        expected = (home_fav & (df["actual_margin"] > df["spread"])) | (
+            ~home_fav & (-df["actual_margin"] > df["spread"]))
+        assert (df["covered"] == expected).all()
+        assert (df["actual_margin"] == df["home_score"] - df["away_score"]).all()
+
+    def test_zones_follow_flag_score(self, conn):
+        df = run_backtest("2025-10-22", "2025-11-30", conn)
+        expected = 5 + 3 * (df["spread"] < 3) + 3 * df["is_b2b"]
+        assert (df["flag_score"] == expected).all()
+        zone = df["flag_score"].map(lambda s: "GREEN" if s >= 8 else "YELLOW" if s >= 5 else "RED")
+        assert (df["zone"] == zone).all()
+
+    def test_missing_vegas_line_leaves_vegas_result_empty(self, conn):
+        df = run_backtest("2025-10-22", "2025-11-30", conn)
+        no_line = df["vegas_spread"].isna()
+        assert no_line.any()
+        assert df.loc[no_line, "covered_vs_vegas"].isna().all()
+
+    def test_parallel_matches_serial(self, conn, tmp_path):
+        db_path = tmp_path / "season.sqlite"
+        file_conn = sqlite3.connect(db_path)
+        conn.backup(file_conn)
+        file_conn.close()
+
+        serial = run_backtest("2025-10-22", "2025-11-30", conn)
+        parallel = run_backtest_parallel("2025-10-22", "2025-11-30", str(db_path), workers=3)
+        pd.testing.assert_frame_equal(parallel, serial)
+
+    def test_parallel_empty_range_matches_serial(self, conn, tmp_path):
+        db_path = tmp_path / "season.sqlite"
+        file_conn = sqlite3.connect(db_path)
+        conn.backup(file_conn)
+        file_conn.close()
+
+        serial = run_backtest("2025-11-30", "2025-10-22", conn)
+        parallel = run_backtest_parallel("2025-11-30", "2025-10-22", str(db_path), workers=3)
+        assert serial.empty and parallel.empty
+
+    def test_report_totals(self, conn):
+        df = run_backtest("2025-10-22", "2025-11-30", conn)
+        report = generate_report(df)
+        overall = report[report["Category"] == "OVERALL"].iloc[0]
+        assert overall["Bets"] == len(df)
+        assert overall["Wins"] == df["covered"].sum()
+
+
+class TestRestInfoBatch:
+    """Test suite for batched rest lookups."""
+
+    def test_matches_single_lookups(self, conn):
+        lookups = [(team, (START + timedelta(days=day)).isoformat())
+                   for team in TEAMS for day in range(0, 40, 3)]
+        batch = get_team_rest_info_batch(lookups, conn)
+        assert batch == {key: get_team_rest_info(*key, conn) for key in lookups}
+        assert any(info["is_b2b"] for info in batch.values())
+
+
+class TestTeamStats:
+    """Test suite for running-total team stats."""
+
+    def test_matches_recent_games_with_missing_score(self, conn):
+        # One final game with no recorded score only blanks the windows containing it
+        game_id, home = conn.execute(
+            "SELECT game_id, home FROM GameStates ORDER BY game_date LIMIT 1 OFFSET 5").fetchone()
+        conn.execute("UPDATE GameStates SET home_score = NULL WHERE game_id = ?", (game_id,))
+
+        logs = load_team_game_logs("2025-12-01", conn)
+        blanked = 0
+        for day in range(1, 40):
+            before = (START + timedelta(days=day)).isoformat()
+            stats = get_team_stats(logs, home, before)
+            expected = calculate_team_stats(get_team_recent_games(home, before, conn), home)
+            if expected is None:
+                assert stats is None
+                continue
+            assert stats["games_count"] == expected["games_count"]
+            assert stats["PPG"] == pytest.approx(expected["PPG"], nan_ok=True)
+            assert stats["OPP_PPG"] == pytest.approx(expected["OPP_PPG"], nan_ok=True)
+            blanked += pd.isna(stats["PPG"])
+        assert 0 < blanked < 30
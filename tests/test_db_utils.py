@@ -0,0 +1,92 @@
+"""
+Tests for db_utils module.
+
+Run with: python -m pytest tests/test_db_utils.py -v
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.db_utils import ensure_indexes, open_db, utc_date_range
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    path = tmp_path / "with space.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE Games (game_id TEXT PRIMARY KEY)")
+    conn.execute("INSERT INTO Games VALUES ('0022500001')")
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+class TestOpenDb:
+    """Test suite for connection helpers."""
+
+    def test_read_only_can_query(self, db_file):
+        conn = open_db(db_file, read_only=True)
+        rows = conn.execute("SELECT game_id FROM Games").fetchall()
+        conn.close()
+        assert rows == [("0022500001",)]
+
+    def test_read_only_rejects_writes(self, db_file):
+        conn = open_db(db_file, read_only=True)
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO Games VALUES ('0022500002')")
+        conn.close()
+
+    def test_read_write_default(self, db_file):
+        conn = open_db(db_file)
+        conn.execute("INSERT INTO Games VALUES ('0022500002')")
+        conn.commit()
+        count = conn.execute("SELECT COUNT(*) FROM Games").fetchone()[0]
+        conn.close()
+        assert count == 2
+
+    def test_read_write_uses_wal_and_row_factory(self, db_file):
+        conn = open_db(db_file, row_factory=sqlite3.Row)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        row = conn.execute("SELECT game_id FROM Games").fetchone()
+        conn.close()
+        assert mode == "wal"
+        assert row["game_id"] == "0022500001"
+
+    def test_ensure_indexes_skips_missing_tables(self, db_file):
+        conn = open_db(db_file)
+        ensure_indexes(conn, (
+            "CREATE INDEX IF NOT EXISTS idx_games_id ON Games(game_id)",
+            "CREATE INDEX IF NOT EXISTS idx_missing ON NotATable(col)",
+        ))
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        assert "idx_games_id" in names
+        assert "idx_missing" not in names
+
+
+class TestUtcDateRange:
+    """Test suite for date_time_utc range bounds."""
+
+    def test_single_day(self):
+        assert utc_date_range("2026-01-31") == ("2026-01-31", "2026-02-01")
+
+    def test_range_matches_date_between(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE Games (date_time_utc TEXT)")
+        conn.executemany("INSERT INTO Games VALUES (?)", [
+            ("2025-12-31T23:59:59Z",), ("2026-01-01T00:00:00Z",),
+            ("2026-01-02T19:30:00Z",), ("2026-01-03T00:30:00Z",),
+        ])
+        by_range = conn.execute(
+            "SELECT date_time_utc FROM Games WHERE date_time_utc >= ? AND date_time_utc < ?",
+            utc_date_range("2026-01-01", "2026-01-02")).fetchall()
+        by_date = conn.execute(
+            "SELECT date_time_utc FROM Games WHERE DATE(date_time_utc) BETWEEN ? AND ?",
+            ("2026-01-01", "2026-01-02")).fetchall()
+        conn.close()
+        assert by_range == by_date == [("2026-01-01T00:00:00Z",), ("2026-01-02T19:30:00Z",)]
@@ -0,0 +1,144 @@
+"""
+Tests for project_props module.
+
+Run with: python -m pytest tests/test_project_props.py -v
+"""
+import random
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.project_props import (
+    STATS,
+    backtest_projections,
+    get_dvp_adjustment,
+    get_last_n_games_avg,
+    get_recent_and_season_avg,
+    get_player_position,
+    get_season_avg,
+    load_player_positions,
+    load_dvp_adjustments,
+    lookup_dvp_adjustment,
+    prior_game_averages,
+)
+
+TEAMS = ["BOS", "LAL", "MIA", "NYK", "GSW", "DEN"]
+POSITIONS = ["PG", "SG", "SF", "PF", "C"]
+
+
+@pytest.fixture
+def conn():
+    """In-memory database with a synthetic slate of box scores and DvP rows."""
+    rng = random.Random(11)
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE Games (
+            game_id TEXT PRIMARY KEY, date_time_utc TEXT, home_team TEXT, away_team TEXT
+        );
+        CREATE TABLE PlayerBox (
+            game_id TEXT, player_name TEXT, min REAL, pts INTEGER,
+            reb INTEGER, ast INTEGER, fg3m INTEGER
+        );
+        CREATE TABLE defense_vs_position (team TEXT, position TEXT, stat TEXT, diff_from_avg REAL);
+        CREATE TABLE player_positions (player_id INTEGER, player_name TEXT, position TEXT);
+    """)
+    for team in TEAMS:
+        for position in POSITIONS:
+            for stat in ["PTS", "REB", "AST", "3PM"]:
+                conn.execute("INSERT INTO defense_vs_position VALUES (?, ?, ?, ?)",
+                             (team, position, stat, round(rng.uniform(-3, 3), 2)))
+    players = [f"Player {i}" for i in range(8)]
+    conn.executemany("INSERT INTO player_positions VALUES (?, ?, ?)",
+                     [(i, p, POSITIONS[i % 5]) for i, p in enumerate(players)])
+
+    for day in range(40):
+        game_id = f"00225{day:05d}"
+        home, away = rng.sample(TEAMS, 2)
+        conn.execute("INSERT INTO Games VALUES (?, ?, ?, ?)",
+                     (game_id, f"2025-11-{day % 30 + 1:02d}T{day // 30:02d}:30:00Z", home, away))
+        for player in players:
+            conn.execute("INSERT INTO PlayerBox VALUES (?, ?, ?, ?, ?, ?, ?)", (
+                game_id, player, rng.choice([0, 24, 32]), rng.randint(0, 35),
+                rng.randint(0, 12), rng.randint(0, 10), rng.randint(0, 5)))
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+class TestBacktestProjections:
+    """Test suite for the projection backtest."""
+
+    def test_samples_per_player_and_stat(self, conn, capsys):
+        df = backtest_projections(conn, num_players=8, num_games=10)
+        assert set(df["stat"]) == set(STATS)
+        assert (df.groupby(["player", "stat"], observed=True).size() == 10).all()
+        assert "OVERALL:" in capsys.readouterr().out
+
+    def test_error_pct_matches_projection(self, conn):
+        df = backtest_projections(conn, num_players=8, num_games=10)
+        scored = df[df["actual"] > 0]
+        expected = (scored["projection"] - scored["actual"]).abs() / scored["actual"] * 100
+        # projection is rounded to 0.1 before this check, error_pct after
+        tolerance = 5 / scored["actual"] + 0.05
+        assert ((scored["error_pct"] - expected).abs() <= tolerance).all()
+        assert set(df.loc[df["actual"] == 0, "error_pct"]) <= {0.0, 100.0}
+        assert df.loc[df["error_pct"] < 15, "within_15"].all()
+        assert not df.loc[df["error_pct"] > 15.1, "within_15"].any()
+
+
+class TestPriorGameAverages:
+    """Test suite for the suffix-sum averages."""
+
+    def test_matches_pandas_slices(self):
+        values = pd.Series([30, 12, np.nan, 25, 18, 22, 9, 40, 27, 15, 33, 21, 19, np.nan, 24], dtype=float)
+        last_10, season = prior_game_averages(values.to_numpy(), 4)
+        for i in range(4):
+            assert last_10[i] == values.iloc[i + 1:i + 11].mean()
+            assert season[i] == values.iloc[i + 1:].mean()
+
+
+class TestDvpAdjustments:
+    """Test suite for prefetched DvP lookups."""
+
+    def test_lookup_matches_query(self, conn):
+        conn.execute("DELETE FROM defense_vs_position WHERE team = 'BOS' AND position = 'C' AND stat = 'REB'")
+        dvp = load_dvp_adjustments(conn)
+        for team in TEAMS + ["XXX"]:
+            for position in POSITIONS:
+                for stat in STATS:
+                    assert lookup_dvp_adjustment(dvp, team, position, stat) == pytest.approx(
+                        get_dvp_adjustment(team, position, stat, conn))
+
+
+class TestPlayerAverages:
+    """Test suite for the combined last-N/season query."""
+
+    def test_matches_separate_queries(self, conn):
+        for stat in STATS:
+            last_10, season = get_recent_and_season_avg("Player 3", stat, conn, n=10)
+            assert last_10 == pytest.approx(get_last_n_games_avg("Player 3", stat, conn, n=10))
+            assert season == pytest.approx(get_season_avg("Player 3", stat, conn))
+
+    def test_unknown_player(self, conn):
+        assert get_recent_and_season_avg("Nobody", "PTS", conn) == (None, None)
+
+
+class TestPlayerPositions:
+    """Test suite for bulk position lookups."""
+
+    def test_matches_single_lookups(self, conn):
+        positions = load_player_positions(conn)
+        for player in ["Player 0", "Player 4", "Nobody"]:
+            assert positions.get(player, "SF") == get_player_position(player, conn)
+
+    def test_missing_table_falls_back(self):
+        conn = sqlite3.connect(":memory:")
+        assert load_player_positions(conn) == {}
+        conn.close()